@@ -1,15 +1,28 @@
-from flask import Flask, jsonify, request, session, redirect, url_for, send_from_directory
+from flask import Flask, jsonify, request, session, redirect, send_from_directory
 from flask_cors import CORS
-from pymongo import MongoClient
+from pymongo import MongoClient, ReturnDocument
 from bson.objectid import ObjectId
 from datetime import datetime
-import random
-import math
 import os
 import re
-import requests
 from dotenv import load_dotenv
-import json
+
+from json_provider import MongoJSONProvider
+
+import catalog_responses
+import catalog_store
+import drops
+import indexes
+import inventory
+import metrics
+import mongo_profiler
+import pricing
+import profile_refresher
+import sales
+import stats
+import scan_tickets
+import steam
+import wallet
 
 # Load environment variables
 load_dotenv()
@@ -18,50 +31,42 @@ app = Flask(__name__, static_folder='../assets', static_url_path='/assets')
 app.secret_key = os.getenv('SECRET_KEY', 'your_secret_key')
 CORS(app)
 
-# Custom JSON encoder to handle ObjectId and datetime
-class CustomJSONEncoder(json.JSONEncoder):
-    def default(self, obj):
-        if isinstance(obj, ObjectId):
-            return str(obj)
-        if isinstance(obj, datetime):
-            return obj.isoformat()
-        return json.JSONEncoder.default(self, obj)
+# ObjectId/datetime aware JSON, encoded in one pass (orjson when available)
+app.json = MongoJSONProvider(app)
+
+# Mongo command counts/timings per request, reported in Server-Timing
+mongo_profiler.init_app(app)
 
-app.json_encoder = CustomJSONEncoder
+# Latency histograms and business counters, exported at /metrics
+metrics.init_app(app)
+metrics.registry.collector(mongo_profiler.metric_samples)
 
 # MongoDB connection
 mongo_uri = os.getenv('MONGO_URI', 'mongodb://localhost:27017/')
 mongo_db = os.getenv('MONGO_DB', 'csgo_cases_db')
 
-client = MongoClient(mongo_uri)
+# Connections per process; gunicorn.conf.py sizes it to the worker's concurrency
+mongo_max_pool_size = int(os.getenv('MONGO_MAX_POOL_SIZE', 100))
+
+client = MongoClient(mongo_uri, maxPoolSize=mongo_max_pool_size,
+                     event_listeners=[mongo_profiler.listener, metrics.pool_listener])
 db = client[mongo_db]
 
+# An index that fails to build is logged, not fatal (duplicate users block the
+# unique steam_id index until migrate_inventory.py merges them)
+indexes.ensure_indexes(db)
+
 # Steam API settings
 STEAM_API_KEY = os.getenv('STEAM_API_KEY', '')
 STEAM_OPENID_URL = 'https://steamcommunity.com/openid/login'
+steam_client = steam.SteamClient(STEAM_API_KEY)
+
+# Names and avatars are refreshed from Steam in the background, never during login
+refresher = profile_refresher.ProfileRefresher(db, steam_client).start()
 
-# Helper function to convert MongoDB document to JSON serializable
-def serialize_doc(doc):
-    if isinstance(doc, dict):
-        result = {}
-        for key, value in doc.items():
-            if key == '_id' and isinstance(value, ObjectId):
-                result[key] = str(value)
-            elif isinstance(value, ObjectId):
-                result[key] = str(value)
-            elif isinstance(value, datetime):
-                result[key] = value.isoformat()
-            elif isinstance(value, dict):
-                result[key] = serialize_doc(value)
-            elif isinstance(value, list):
-                result[key] = [serialize_doc(item) for item in value]
-            else:
-                result[key] = value
-        return result
-    elif isinstance(doc, list):
-        return [serialize_doc(item) for item in doc]
-    else:
-        return doc
+@app.route('/metrics')
+def get_metrics():
+    return metrics.registry.render(), 200, {'Content-Type': 'text/plain; version=0.0.4; charset=utf-8'}
 
 # Serve static files
 @app.route('/')
@@ -98,131 +103,147 @@ def auth():
     
     steam_id = match.group(1)
     
-    # Получение информации о пользователе
-    user_info = get_steam_user_info(steam_id)
-    
-    if user_info:
-        # Сохраняем информацию о пользователе в сессии
-        session['steam_id'] = steam_id
-        session['steam_username'] = user_info['personaname']
-        session['steam_avatar'] = user_info['avatar']
-        
-        # Проверяем, существует ли пользователь в БД
-        user = db.users.find_one({"steam_id": steam_id})
-        
-        if user:
-            # Обновляем существующего пользователя
-            db.users.update_one(
-                {"steam_id": steam_id},
-                {"$set": {
-                    "username": user_info['personaname'],
-                    "avatar": user_info['avatar'],
-                    "last_login": datetime.now()
-                }}
+    # Steam не вызываем: имя и аватар обновляет фоновый profile_refresher
+    user = db.users.find_one_and_update(
+        {"steam_id": steam_id},
+        {
+            "$set": {"last_login": datetime.now()},
+            "$setOnInsert": dict(
+                profile_refresher.placeholder_profile(steam_id),
+                **inventory.empty_totals(),
+                balance=100.0,  # Начальный баланс
+                created_at=datetime.now()
             )
-        else:
-            # Создаем нового пользователя
-            db.users.insert_one({
-                "steam_id": steam_id,
-                "username": user_info['personaname'],
-                "avatar": user_info['avatar'],
-                "balance": 100.0,  # Начальный баланс
-                "inventory": [],
-                "created_at": datetime.now(),
-                "last_login": datetime.now()
-            })
-        
-        return redirect('/pages/profile.html')
-    
-    return 'Authentication failed. <a href="/api/login">Try again</a>', 400
-
-def get_steam_user_info(steam_id):
-    # Получение информации о пользователе через Steam API
-    if not STEAM_API_KEY:
-        # Если нет API ключа, возвращаем заглушку
-        return {
-            'personaname': f'User_{steam_id[-5:]}',
-            'avatar': 'https://steamcdn-a.akamaihd.net/steamcommunity/public/images/avatars/fe/fef49e7fa7e1997310d705b2a6158ff8dc1cdfeb.jpg'
-        }
-        
-    response = requests.get(
-        f'https://api.steampowered.com/ISteamUser/GetPlayerSummaries/v0002/',
-        params={
-            'key': STEAM_API_KEY,
-            'steamids': steam_id
-        }
+        },
+        projection={"username": 1, "avatar": 1, "profile_refreshed_at": 1},
+        upsert=True,
+        return_document=ReturnDocument.AFTER
     )
     
-    if response.status_code == 200:
-        data = response.json()
-        if data['response']['players']:
-            return data['response']['players'][0]
+    # Новый пользователь получит настоящий профиль через пару секунд
+    if not user.get('profile_refreshed_at'):
+        refresher.wake()
     
-    return None
+    # Сохраняем информацию о пользователе в сессии
+    session['steam_id'] = steam_id
+    session['steam_username'] = user['username']
+    session['steam_avatar'] = user['avatar']
+    
+    return redirect('/pages/profile.html')
 
 @app.route('/api/logout')
 def logout():
     session.pop('steam_id', None)
     session.pop('steam_username', None)
     session.pop('steam_avatar', None)
-    session.pop('scanned_item', None)  # Очищаем информацию о просканированном предмете
     return redirect('/pages/profile.html')
 
 # API routes
 @app.route('/api/cases')
 def get_cases():
-    cases = list(db.cases.find())
-    return jsonify([serialize_doc(case) for case in cases])
+    # Encoded once per catalog version, 304 when the client is up to date
+    return catalog_responses.send(catalog_responses.get_cases(db))
 
 @app.route('/api/case/<case_id>')
 def get_case(case_id):
     try:
-        case = db.cases.find_one({"_id": ObjectId(case_id)})
-        if not case:
+        encoded = catalog_responses.get_case(db, ObjectId(case_id))
+        if not encoded:
             return jsonify({"error": "Case not found"}), 404
             
-        skins = list(db.skins.find({"case_id": ObjectId(case_id)}))
-        
-        return jsonify({
-            "case": serialize_doc(case),
-            "skins": [serialize_doc(skin) for skin in skins]
-        })
+        return catalog_responses.send(encoded)
     except Exception as e:
         return jsonify({"error": str(e)}), 500
 
+def inventory_item_response(item, skin):
+    """Build the client-facing representation of one inventory entry"""
+    inventory_item = {
+        "_id": str(item['_id']),
+        "skin": skin,
+        "float": item['float'],
+        "obtained_at": item['obtained_at']
+    }
+    
+    # Add StatTrak™ if applicable
+    if item.get('is_stattrak', False):
+        inventory_item["is_stattrak"] = True
+    
+    # Add special pattern if applicable
+    if item.get('special_pattern'):
+        inventory_item["special_pattern"] = item['special_pattern']
+        
+    return inventory_item
+
+# Query parameters that switch /api/inventory to the paginated response
+INVENTORY_PAGE_PARAMS = ('limit', 'cursor', 'sort', 'order', 'q', 'rarity', 'stattrak', 'case_id')
+
 @app.route('/api/inventory')
 def get_inventory():
     if 'steam_id' not in session:
         return jsonify({"error": "Not logged in"}), 401
         
+    if any(param in request.args for param in INVENTORY_PAGE_PARAMS):
+        return get_inventory_page()
+        
     try:
-        user = db.users.find_one({"steam_id": session['steam_id']})
-        if not user:
-            return jsonify({"error": "User not found"}), 404
-            
-        inventory = []
+        # Legacy embedded inventories move over, and sales interrupted by a crash get finished or undone first
+        inventory.ensure_migrated(db, session['steam_id'])
+        sales.recover(db, session['steam_id'])
+        items = list(inventory.find_all(db, session['steam_id']))
+        
+        # Skins come from the in-memory catalog
+        store = catalog_store.get_store(db)
+        
+        inventory_items = []
         
-        for item in user.get('inventory', []):
-            skin = db.skins.find_one({"_id": ObjectId(item['skin_id'])})
+        for item in items:
+            skin = store.skin(ObjectId(item['skin_id']))
             if skin:
-                inventory_item = {
-                    "_id": str(item['_id']),
-                    "skin": serialize_doc(skin),
-                    "float": item['float'],
-                    "obtained_at": item['obtained_at']
-                }
+                inventory_items.append(inventory_item_response(item, skin))
                 
-                # Add StatTrak™ if applicable
-                if item.get('is_stattrak', False):
-                    inventory_item["is_stattrak"] = True
-                
-                # Add special pattern if applicable
-                if item.get('special_pattern'):
-                    inventory_item["special_pattern"] = item['special_pattern']
-                    
-                inventory.append(inventory_item)
-                
-        return jsonify(inventory)
+        return jsonify(inventory_items)
+    except Exception as e:
+        return jsonify({"error": str(e)}), 500
+
+def get_inventory_page():
+    """One server-sorted page of the inventory: ?sort=&order=&limit=&cursor= plus filters"""
+    try:
+        query = inventory.parse_query(request.args)
+    except inventory.InvalidQuery as e:
+        return jsonify({"error": str(e)}), 400
+        
+    try:
+        # Legacy embedded inventories move over, and sales interrupted by a crash get finished or undone first
+        if not query['cursor']:
+            inventory.ensure_migrated(db, session['steam_id'])
+            sales.recover(db, session['steam_id'])
+        items, next_cursor = inventory.find_page(db, session['steam_id'], **query)
+        
+        # Sell prices for the whole page in one pass
+        price_book = pricing.get_price_book(db)
+        priced = [item for item in items if item['skin_id'] in price_book]
+        sell_prices = dict(zip((item['_id'] for item in priced), price_book.sell_prices(priced)))
+        
+        page_items = []
+        for item in items:
+            page_item = inventory_item_response(item, item['skin'])
+            if item['_id'] in sell_prices:
+                page_item["sell_price"] = sell_prices[item['_id']]
+            page_items.append(page_item)
+        
+        response_data = {
+            "items": page_items,
+            "next_cursor": next_cursor
+        }
+        
+        # Totals are only sent with the first page
+        if not query['cursor']:
+            summary = inventory.summarize(db, session['steam_id'])
+            if summary is None:
+                return jsonify({"error": "User not found"}), 404
+            response_data.update(summary)
+        
+        return jsonify(response_data)
     except Exception as e:
         return jsonify({"error": str(e)}), 500
 
@@ -233,156 +254,44 @@ def scan_case(case_id):
         return jsonify({"error": "Not logged in"}), 401
         
     try:
-        # Get user
-        user = db.users.find_one({"steam_id": session['steam_id']})
-        if not user:
-            return jsonify({"error": "User not found"}), 404
-            
-        # Get case
-        case = db.cases.find_one({"_id": ObjectId(case_id)})
-        if not case:
+        # Get the compiled drop table (no catalog queries once it is cached)
+        table = drops.get_drop_table(db, case_id)
+        if not table:
             return jsonify({"error": "Case not found"}), 404
-        
-        # Calculate scanning fee (5% of case price, minimum 10 RC)
-        scan_fee = max(case['price'] * 0.05, 10)
-        scan_fee = round(scan_fee, 2)  # Round to 2 decimal places
-        
-        # Check if user has enough balance for scanning
-        if user['balance'] < scan_fee:
-            return jsonify({"error": f"Недостаточно средств для сканирования. Необходимо: {scan_fee} RC"}), 400
-            
-        # Deduct scan fee from user balance
-        db.users.update_one(
-            {"_id": user['_id']},
-            {"$inc": {"balance": -scan_fee}}
-        )
             
-        # Get skins for this case
-        skins = list(db.skins.find({"case_id": ObjectId(case_id)}))
-        
-        if not skins:
+        if table.is_empty:
             return jsonify({"error": "No skins found for this case"}), 404
-            
-        # Adjusted rarity weights - reduced chances for Covert items
-        rarities = {
-            "Consumer Grade": {"weight": 2800, "float_curve": "normal"},     # Increased
-            "Industrial Grade": {"weight": 2200, "float_curve": "normal"},   # Increased
-            "Mil-Spec": {"weight": 1600, "float_curve": "normal"},           # Increased
-            "Restricted": {"weight": 650, "float_curve": "normal"},
-            "Classified": {"weight": 120, "float_curve": "normal"},
-            "Covert": {"weight": 30, "float_curve": "slightly_right_skewed"}, # Reduced from 65 to 30
-            "Exceedingly Rare": {"weight": 15, "float_curve": "left_skewed"} # Reduced from 25 to 15
-        }
         
-        # Group skins by rarity and type
-        skins_by_category = {}
-        
-        for skin in skins:
-            rarity = skin['quality']['title']
-            weapon_type = skin['weapon']['type']
-            
-            # Create special category for knives and gloves
-            if weapon_type in ["knife", "gloves"]:
-                category = f"Exceedingly Rare_{weapon_type}"
-            else:
-                category = rarity
-                
-            if category not in skins_by_category:
-                skins_by_category[category] = []
-            
-            skins_by_category[category].append(skin)
+        # Scanning fee (5% of case price, minimum 10 RC)
+        scan_fee = table.scan_fee
         
-        # First, decide if we're dropping a special item (knife/glove)
-        special_item_chance = 0.0015  # Reduced from 0.25% to 0.15% chance
-        is_special_item = random.random() < special_item_chance
+        # Deduct scan fee in one conditional write, which also returns the new balance
+        try:
+            new_balance = wallet.debit(db, session['steam_id'], scan_fee)
+        except wallet.UserNotFound:
+            return jsonify({"error": "User not found"}), 404
+        except wallet.InsufficientBalance:
+            return jsonify({"error": f"Недостаточно средств для сканирования. Необходимо: {scan_fee} RC"}), 400
         
-        if is_special_item and "Exceedingly Rare_knife" in skins_by_category:
-            # Knife drop!
-            won_skin = random.choice(skins_by_category["Exceedingly Rare_knife"])
-            float_curve = "left_skewed"
-        else:
-            # Calculate total weight for non-special rarities
-            available_rarities = [r for r in rarities.keys() if r in skins_by_category and r != "Exceedingly Rare"]
-            
-            if not available_rarities:
-                # Fallback if no non-special rarities found
-                available_categories = list(skins_by_category.keys())
-                if not available_categories:
-                    return jsonify({"error": "No appropriate skins found for this case"}), 404
-                    
-                # Pick a random category and skin
-                chosen_category = random.choice(available_categories)
-                won_skin = random.choice(skins_by_category[chosen_category])
-                float_curve = "normal"
-            else:
-                # Calculate total weight
-                total_weight = sum(rarities[r]["weight"] for r in available_rarities)
-                
-                # Roll for rarity
-                roll = random.uniform(0, total_weight)
-                current_weight = 0
-                chosen_rarity = available_rarities[-1]  # Default to highest available rarity
-                
-                for rarity in available_rarities:
-                    current_weight += rarities[rarity]["weight"]
-                    if roll <= current_weight:
-                        chosen_rarity = rarity
-                        break
-                
-                # Select a random skin from chosen rarity
-                won_skin = random.choice(skins_by_category[chosen_rarity])
-                float_curve = rarities[chosen_rarity]["float_curve"]
-        
-        # Generate float value based on rarity
-        min_float = won_skin['min_float']
-        max_float = won_skin['max_float']
-        float_range = max_float - min_float
-        
-        # Apply different distribution based on rarity
-        if float_curve == "normal":
-            # Normal distribution centered in the middle of the range
-            mu = min_float + float_range / 2
-            sigma = float_range / 6
-            item_float = random.normalvariate(mu, sigma)
-            # Ensure the float stays within bounds
-            item_float = max(min_float, min(max_float, item_float))
-        elif float_curve == "slightly_right_skewed":
-            # Beta distribution for slightly right-skewed (more lower floats)
-            alpha, beta = 2, 3
-            raw_float = random.betavariate(alpha, beta)
-            item_float = min_float + raw_float * float_range
-        elif float_curve == "left_skewed":
-            # Beta distribution for left-skewed (more higher floats)
-            alpha, beta = 3, 2
-            raw_float = random.betavariate(alpha, beta)
-            item_float = min_float + raw_float * float_range
-        else:
-            # Uniform distribution as fallback
-            item_float = random.uniform(min_float, max_float)
-        
-        # Round to 8 decimal places (CS:GO standard)
-        item_float = round(item_float, 8)
-        
-        # Determine if the item is StatTrak™ - reduced chance
-        stattrak_chance = 0.04  # Reduced from 10% to 4% chance
-        is_stattrak = won_skin.get('stattrak', False) or (random.random() < stattrak_chance)
-        
-        # Store the scanned item in session for later retrieval
-        session['scanned_item'] = {
-            'skin_id': str(won_skin['_id']),
-            'case_id': str(case_id),
-            'float': item_float,
-            'is_stattrak': is_stattrak
-        }
+        # Roll the item: rarity, float and StatTrak™
+        won_ref, item_float, is_stattrak = table.open()
+        won_skin = won_ref.doc
         
-        # Get updated user balance
-        updated_user = db.users.find_one({"_id": user['_id']})
+        # Keep the result server-side; the client gets an opaque ticket id. Refund if it fails
+        try:
+            ticket_id = scan_tickets.issue(db, session['steam_id'], case_id, won_skin['_id'], item_float, is_stattrak)
+        except Exception:
+            wallet.credit(db, session['steam_id'], scan_fee)
+            raise
+        metrics.inc('cases_scanned_total')
+        metrics.inc('rc_spent_total', scan_fee)
         
         response_data = {
-            "wonItem": serialize_doc(won_skin),
+            "ticket": ticket_id,
+            "wonItem": won_skin,
             "float": item_float,
             "scan_fee": scan_fee,
-            "new_balance": updated_user['balance']
+            "new_balance": new_balance
         }
         
         # Add StatTrak™ status if applicable
@@ -401,72 +310,70 @@ def claim_scanned_case(case_id):
     if 'steam_id' not in session:
         return jsonify({"error": "Not logged in"}), 401
         
-    if 'scanned_item' not in session:
-        return jsonify({"error": "No scanned item found"}), 400
-        
-    scanned_item = session['scanned_item']
-    
-    # Verify this is the correct case
-    if scanned_item['case_id'] != case_id:
-        return jsonify({"error": "Case mismatch"}), 400
-        
     try:
-        # Get user
-        user = db.users.find_one({"steam_id": session['steam_id']})
-        if not user:
-            return jsonify({"error": "User not found"}), 404
+        steam_id = session['steam_id']
+        
+        # Find the scan: the ticket the client sent, or its latest one for this case
+        ticket_id = (request.get_json(silent=True) or {}).get('ticket')
+        if ticket_id:
+            ticket = scan_tickets.get(db, steam_id, str(ticket_id))
+        else:
+            ticket = scan_tickets.latest(db, steam_id, case_id)
+        if not ticket:
+            return jsonify({"error": "No scanned item found"}), 400
+            
+        # Verify this is the correct case
+        if ticket['case_id'] != case_id:
+            return jsonify({"error": "Case mismatch"}), 400
             
         # Get case
-        case = db.cases.find_one({"_id": ObjectId(case_id)})
-        if not case:
+        table = drops.get_drop_table(db, case_id)
+        if not table:
             return jsonify({"error": "Case not found"}), 404
             
-        # Check if user has enough balance
-        if user['balance'] < case['price']:
-            return jsonify({"error": "Insufficient balance"}), 400
-            
         # Get the skin
-        won_skin = db.skins.find_one({"_id": ObjectId(scanned_item['skin_id'])})
-        if not won_skin:
+        won_ref = table.skins_by_id.get(ticket['skin_id'])
+        if not won_ref:
             return jsonify({"error": "Item not found"}), 404
+        won_skin = won_ref.doc
             
         # Use the saved values
-        item_float = scanned_item['float']
-        is_stattrak = scanned_item.get('is_stattrak', False)
-        
-        # Deduct case price from user balance
-        db.users.update_one(
-            {"_id": user['_id']},
-            {"$inc": {"balance": -case['price']}}
-        )
-        
-        # Add item to user's inventory
-        inventory_item_id = ObjectId()
-        
-        inventory_item = {
-            "_id": inventory_item_id,
-            "skin_id": won_skin['_id'],
-            "float": item_float,
-            "obtained_at": datetime.now()
-        }
-        
-        # Add StatTrak™ if applicable
-        if is_stattrak:
-            inventory_item["is_stattrak"] = True
-        
-        db.users.update_one(
-            {"_id": user['_id']},
-            {"$push": {"inventory": inventory_item}}
-        )
+        item_float = ticket['float']
+        is_stattrak = ticket.get('is_stattrak', False)
+        
+        # Take the ticket; a concurrent claim of the same scan gets nothing
+        ticket = scan_tickets.consume(db, steam_id, ticket['_id'])
+        if not ticket:
+            return jsonify({"error": "No scanned item found"}), 400
+            
+        new_item = inventory.new_item(steam_id, won_skin, item_float, is_stattrak)
+        totals = inventory.totals_delta(pricing.get_price_book(db), [new_item])
+        
+        # Deduct case price and count the item in one write; on failure the scan stays claimable
+        try:
+            new_balance = wallet.debit(db, steam_id, table.price, totals)
+        except wallet.WalletError as e:
+            scan_tickets.restore(db, ticket)
+            if isinstance(e, wallet.UserNotFound):
+                return jsonify({"error": "User not found"}), 404
+            return jsonify({"error": "Insufficient balance"}), 400
         
-        # Clear the scanned item from session
-        session.pop('scanned_item', None)
+        # Add item to user's inventory; refund if it fails
+        try:
+            db.inventory_items.insert_one(new_item)
+        except Exception:
+            wallet.credit(db, steam_id, table.price, inventory.totals_delta(pricing.get_price_book(db), [new_item], -1))
+            scan_tickets.restore(db, ticket)
+            raise
+        metrics.inc('cases_claimed_total')
+        metrics.inc('rc_spent_total', table.price)
         
         # Prepare response
         response_data = {
             "success": True,
-            "wonItem": serialize_doc(won_skin),
-            "float": item_float
+            "wonItem": won_skin,
+            "float": item_float,
+            "new_balance": new_balance
         }
         
         if is_stattrak:
@@ -477,16 +384,103 @@ def claim_scanned_case(case_id):
     except Exception as e:
         return jsonify({"error": str(e)}), 500
 
+@app.route('/api/open-cases/<case_id>', methods=['POST'])
+def open_cases(case_id):
+    """Open several cases at once: one vectorized draw, one balance debit, one inventory write"""
+    if 'steam_id' not in session:
+        return jsonify({"error": "Not logged in"}), 401
+        
+    try:
+        data = request.json or {}
+        try:
+            count = int(data.get('count', 1))
+        except (TypeError, ValueError):
+            count = 0
+        
+        if count < 1 or count > drops.MAX_BULK_OPEN:
+            return jsonify({"error": f"Count must be between 1 and {drops.MAX_BULK_OPEN}"}), 400
+            
+        table = drops.get_drop_table(db, case_id)
+        if not table:
+            return jsonify({"error": "Case not found"}), 404
+            
+        if table.is_empty:
+            return jsonify({"error": "No skins found for this case"}), 404
+            
+        total_cost = round(table.price * count, 2)
+        
+        # Draw all outcomes in one pass
+        results = table.open_many(count)
+        
+        obtained_at = datetime.now()
+        inventory_items = []
+        opened = []
+        
+        for won_ref, item_float, is_stattrak in results:
+            inventory_item = inventory.new_item(session['steam_id'], won_ref.doc, item_float,
+                                                is_stattrak, obtained_at)
+            
+            opened_item = {
+                "_id": str(inventory_item["_id"]),
+                "wonItem": won_ref.doc,
+                "float": item_float
+            }
+            
+            # Add StatTrak™ if applicable
+            if is_stattrak:
+                opened_item["is_stattrak"] = True
+                
+            inventory_items.append(inventory_item)
+            opened.append(opened_item)
+        
+        # Debit the balance and count the items once, with a conditional write
+        price_book = pricing.get_price_book(db)
+        try:
+            new_balance = wallet.debit(db, session['steam_id'], total_cost,
+                                       inventory.totals_delta(price_book, inventory_items))
+        except wallet.UserNotFound:
+            return jsonify({"error": "User not found"}), 404
+        except wallet.InsufficientBalance:
+            return jsonify({"error": "Insufficient balance"}), 400
+            
+        # Add every item in one write; refund if it fails
+        try:
+            db.inventory_items.insert_many(inventory_items, ordered=False)
+        except Exception:
+            wallet.credit(db, session['steam_id'], total_cost, inventory.totals_delta(price_book, inventory_items, -1))
+            raise
+        metrics.inc('cases_opened_total', count)
+        metrics.inc('rc_spent_total', total_cost)
+        
+        return jsonify({
+            "success": True,
+            "items": opened,
+            "total_cost": total_cost,
+            "new_balance": new_balance
+        })
+        
+    except Exception as e:
+        return jsonify({"error": str(e)}), 500
+
 @app.route('/api/discard-case', methods=['POST'])
 def discard_case():
-    """Clean up session data after discarding a case"""
+    """Drop a pending scan: {"ticket": id} or every scan of {"caseId": id}"""
     if 'steam_id' not in session:
         return jsonify({"error": "Not logged in"}), 401
-    
-    # Clear the scanned item
-    session.pop('scanned_item', None)
-    
-    return jsonify({"success": True})
+        
+    try:
+        data = request.get_json(silent=True) or {}
+        ticket_id = data.get('ticket')
+        case_id = data.get('caseId')
+        if not ticket_id and not case_id:
+            return jsonify({"error": "ticket or caseId is required"}), 400
+        scan_tickets.discard(db, session['steam_id'],
+                             str(ticket_id) if ticket_id else None, str(case_id) if case_id else None)
+        
+        return jsonify({"success": True})
+        
+    except Exception as e:
+        return jsonify({"error": str(e)}), 500
 
 @app.route('/api/sell-item/<item_id>', methods=['POST'])
 def sell_item(item_id):
@@ -494,87 +488,37 @@ def sell_item(item_id):
         return jsonify({"error": "Not logged in"}), 401
         
     try:
-        # Get user
-        user = db.users.find_one({"steam_id": session['steam_id']})
-        if not user:
-            return jsonify({"error": "User not found"}), 404
+        steam_id = session['steam_id']
+        
+        # A malformed id can't be in anyone's inventory
+        if not ObjectId.is_valid(item_id):
+            return jsonify({"error": "Item not found in inventory"}), 404
             
-        # Find the item in user's inventory
-        inventory_item = None
-        for item in user.get('inventory', []):
-            if str(item['_id']) == item_id:
-                inventory_item = item
-                break
+        # Find the item in user's inventory (moving a legacy embedded one over first)
+        inventory.ensure_migrated(db, steam_id)
+        inventory_item = db.inventory_items.find_one({"_id": ObjectId(item_id), "steam_id": steam_id})
                 
         if not inventory_item:
             return jsonify({"error": "Item not found in inventory"}), 404
             
-        # Get the skin details
-        skin = db.skins.find_one({"_id": inventory_item['skin_id']})
-        if not skin:
+        # Price the item from the compiled price book
+        price_book = pricing.get_price_book(db)
+        if inventory_item['skin_id'] not in price_book:
             return jsonify({"error": "Skin not found"}), 404
             
-        # Base sell price (90% of market value)
-        base_price = skin['price'] * 0.9
-        
-        # Price modifiers based on special attributes
-        price_multiplier = 1.0
-        
-        # Float value adjustment
-        if skin.get('min_float') is not None and skin.get('max_float') is not None:
-            float_range = skin['max_float'] - skin['min_float']
-            if float_range > 0:
-                # Calculate how good the float is (0 = worst, 1 = best)
-                float_quality = 1 - ((inventory_item['float'] - skin['min_float']) / float_range)
-                
-                # Apply float quality multiplier (1.0 to 1.3)
-                float_multiplier = 1 + (float_quality * 0.3)
-                price_multiplier *= float_multiplier
-        
-        # StatTrak™ adjustment (2x for StatTrak™)
-        if inventory_item.get('is_stattrak', False):
-            price_multiplier *= 2.0
-            
-        # Special pattern adjustment
-        if inventory_item.get('special_pattern'):
-            # Special patterns can be worth a lot more
-            pattern_multipliers = {
-                "Fade": 1.5,
-                "Marble Fade": 1.8,
-                "Tiger Tooth": 1.7,
-                "Doppler Ruby": 4.0,
-                "Doppler Sapphire": 5.0,
-                "Doppler Black Pearl": 3.5,
-                "Blue Gem": 3.0,
-                "Fire and Ice": 2.5
-            }
+        # Reserve, pay, then remove the item; nothing is sold if another sale has it
+        prices, new_balance = sales.sell(db, steam_id, [inventory_item], price_book)
+        if not prices:
+            return jsonify({"error": "Item not found in inventory"}), 404
             
-            pattern = inventory_item['special_pattern']
-            if pattern in pattern_multipliers:
-                price_multiplier *= pattern_multipliers[pattern]
-            else:
-                price_multiplier *= 1.5  # Default multiplier for unspecified patterns
-        
-        # Calculate final sell price
-        sell_price = base_price * price_multiplier
-        sell_price = round(sell_price, 2)  # Round to 2 decimal places
-        
-        # Remove item from inventory and add balance
-        db.users.update_one(
-            {"_id": user['_id']},
-            {
-                "$pull": {"inventory": {"_id": ObjectId(item_id)}},
-                "$inc": {"balance": sell_price}
-            }
-        )
-        
-        # Get updated user balance
-        updated_user = db.users.find_one({"_id": user['_id']})
+        sell_price = prices[inventory_item['_id']]
+        metrics.inc('items_sold_total')
+        metrics.inc('rc_paid_out_total', sell_price)
         
         return jsonify({
             "success": True,
             "sold_for": sell_price,
-            "new_balance": updated_user['balance']
+            "new_balance": new_balance
         })
         
     except Exception as e:
@@ -586,20 +530,35 @@ def get_user():
         return jsonify({"error": "Not logged in"}), 401
         
     try:
-        user = db.users.find_one({"steam_id": session['steam_id']})
+        # Only the first legacy embedded item (if any) is read, to spot unmigrated users
+        user = db.users.find_one({"steam_id": session['steam_id']}, {
+            "steam_id": 1, "username": 1, "avatar": 1, "balance": 1,
+            "created_at": 1, "last_login": 1, "inventory": {"$slice": 1},
+            "inventory_count": 1, inventory.COUNTED_FIELD: 1
+        })
         if not user:
             return jsonify({"error": "User not found"}), 404
             
+        # Move a legacy embedded inventory into inventory_items on first visit
+        if user.get('inventory'):
+            inventory.migrate_user(db, user['steam_id'])
+            
+        # The maintained counter, once the user has been fully counted
+        if user.get(inventory.COUNTED_FIELD) and not user.get('inventory'):
+            inventory_count = user['inventory_count']
+        else:
+            inventory_count = inventory.count(db, user['steam_id'])
+            
         # Don't return inventory here to keep response small
-        user_data = serialize_doc({
+        user_data = {
             "steam_id": user['steam_id'],
             "username": user['username'],
             "avatar": user['avatar'],
             "balance": user['balance'],
-            "inventory_count": len(user.get('inventory', [])),
+            "inventory_count": inventory_count,
             "created_at": user['created_at'],
             "last_login": user['last_login']
-        })
+        }
         
         return jsonify(user_data)
         
@@ -621,12 +580,13 @@ def add_funds():
         # In a real app, you would process payment here
         
         # Update user balance
-        db.users.update_one(
-            {"steam_id": session['steam_id']},
-            {"$inc": {"balance": amount}}
-        )
+        try:
+            new_balance = wallet.credit(db, session['steam_id'], amount)
+        except wallet.UserNotFound:
+            return jsonify({"error": "User not found"}), 404
+        metrics.inc('rc_deposited_total', amount)
         
-        return jsonify({"success": True})
+        return jsonify({"success": True, "new_balance": new_balance})
         
     except Exception as e:
         return jsonify({"error": str(e)}), 500
@@ -641,185 +601,82 @@ def sell_items():
         data = request.json
         item_ids = data.get('item_ids', [])
         
-        if not item_ids or not isinstance(item_ids, list):
+        if not item_ids or not isinstance(item_ids, list) or not all(isinstance(item_id, str) for item_id in item_ids):
             return jsonify({"error": "Invalid item IDs"}), 400
             
-        # Get user
-        user = db.users.find_one({"steam_id": session['steam_id']})
-        if not user:
-            return jsonify({"error": "User not found"}), 404
-            
+        steam_id = session['steam_id']
         total_price = 0
         sold_items = []
         
-        # Process each item
+        # Load the requested items that belong to this user, indexed by id
+        inventory.ensure_migrated(db, steam_id)
+        object_ids = list({ObjectId(item_id) for item_id in item_ids if ObjectId.is_valid(item_id)})
+        owned_items = {
+            str(item['_id']): item
+            for item in db.inventory_items.find({"_id": {"$in": object_ids}, "steam_id": steam_id})
+        }
+        
+        # Keep each requested item once, skipping items not found or whose skin is gone
+        price_book = pricing.get_price_book(db)
+        sellable = {}
         for item_id in item_ids:
-            # Find the item in user's inventory
-            inventory_item = None
-            for item in user.get('inventory', []):
-                if str(item['_id']) == item_id:
-                    inventory_item = item
-                    break
-                    
-            if not inventory_item:
-                continue  # Skip items not found
-                
-            # Get the skin details
-            skin = db.skins.find_one({"_id": inventory_item['skin_id']})
-            if not skin:
-                continue  # Skip if skin not found
-                
-            # Base sell price (90% of market value)
-            base_price = skin['price'] * 0.9
-            
-            # Price modifiers based on special attributes
-            price_multiplier = 1.0
-            
-            # Float value adjustment
-            if skin.get('min_float') is not None and skin.get('max_float') is not None:
-                float_range = skin['max_float'] - skin['min_float']
-                if float_range > 0:
-                    # Calculate how good the float is (0 = worst, 1 = best)
-                    float_quality = 1 - ((inventory_item['float'] - skin['min_float']) / float_range)
-                    
-                    # Apply float quality multiplier (1.0 to 1.3)
-                    float_multiplier = 1 + (float_quality * 0.3)
-                    price_multiplier *= float_multiplier
-            
-            # StatTrak™ adjustment (2x for StatTrak™)
-            if inventory_item.get('is_stattrak', False):
-                price_multiplier *= 2.0
-                
-            # Special pattern adjustment
-            if inventory_item.get('special_pattern'):
-                # Special patterns can be worth a lot more
-                pattern_multipliers = {
-                    "Fade": 1.5,
-                    "Marble Fade": 1.8,
-                    "Tiger Tooth": 1.7,
-                    "Doppler Ruby": 4.0,
-                    "Doppler Sapphire": 5.0,
-                    "Doppler Black Pearl": 3.5,
-                    "Blue Gem": 3.0,
-                    "Fire and Ice": 2.5
-                }
-                
-                pattern = inventory_item['special_pattern']
-                if pattern in pattern_multipliers:
-                    price_multiplier *= pattern_multipliers[pattern]
-                else:
-                    price_multiplier *= 1.5  # Default multiplier for unspecified patterns
-            
-            # Calculate final sell price
-            sell_price = base_price * price_multiplier
-            sell_price = round(sell_price, 2)  # Round to 2 decimal places
-            
-            total_price += sell_price
-            sold_items.append({"item_id": item_id, "sold_for": sell_price})
+            inventory_item = owned_items.get(item_id)
+            if inventory_item and inventory_item['skin_id'] in price_book:
+                sellable[item_id] = inventory_item
+        
+        # Reserve, pay for and remove them together; items another sale holds are skipped
+        try:
+            prices, new_balance = sales.sell(db, steam_id, list(sellable.values()), price_book)
+        except wallet.UserNotFound:
+            return jsonify({"error": "User not found"}), 404
             
-            # Remove item from inventory
-            db.users.update_one(
-                {"_id": user['_id']},
-                {"$pull": {"inventory": {"_id": ObjectId(item_id)}}}
-            )
+        for item_id, inventory_item in sellable.items():
+            if inventory_item['_id'] in prices:
+                sell_price = prices[inventory_item['_id']]
+                total_price += sell_price
+                sold_items.append({"item_id": item_id, "sold_for": sell_price})
         
-        # Add total balance
-        if total_price > 0:
-            db.users.update_one(
-                {"_id": user['_id']},
-                {"$inc": {"balance": total_price}}
-            )
-        
-        # Get updated user balance
-        updated_user = db.users.find_one({"_id": user['_id']})
+        metrics.inc('items_sold_total', len(sold_items))
+        metrics.inc('rc_paid_out_total', total_price)
         
         return jsonify({
             "success": True,
             "sold_items": sold_items,
             "total_sold_for": total_price,
-            "new_balance": updated_user['balance']
+            "new_balance": new_balance
         })
         
     except Exception as e:
         return jsonify({"error": str(e)}), 500
 
+
 # Added new endpoint for case statistics
 @app.route('/api/case-stats/<case_id>')
 def get_case_stats(case_id):
     try:
-        # Get case details
-        case = db.cases.find_one({"_id": ObjectId(case_id)})
-        if not case:
+        # Stats are computed once per catalog version
+        entry = stats.get_case_stats(db, ObjectId(case_id))
+        if not entry:
             return jsonify({"error": "Case not found"}), 404
             
-        # Get all skins for this case
-        skins = list(db.skins.find({"case_id": ObjectId(case_id)}))
-        
-        if not skins:
+        if not entry['stats']:
             return jsonify({"error": "No skins found for this case"}), 404
         
-        # Group skins by rarity
-        skins_by_rarity = {}
-        for skin in skins:
-            rarity = skin['quality']['title']
-            if rarity not in skins_by_rarity:
-                skins_by_rarity[rarity] = []
-            skins_by_rarity[rarity].append(skin)
-            
-        # Calculate odds and expected value
-        rarities = {
-            "Consumer Grade": {"weight": 7980, "odds": 0},
-            "Industrial Grade": {"weight": 1598, "odds": 0},
-            "Mil-Spec": {"weight": 319.6, "odds": 0},
-            "Restricted": {"weight": 63.98, "odds": 0},
-            "Classified": {"weight": 12.8, "odds": 0},
-            "Covert": {"weight": 2.56, "odds": 0},
-            "Exceedingly Rare": {"weight": 3.2, "odds": 0}
-        }
-        
-        # Calculate total weight for available rarities
-        total_weight = sum(data["weight"] for rarity, data in rarities.items() if rarity in skins_by_rarity)
-        
-        # Calculate odds and expected values
-        expected_value = 0
-        rarity_stats = []
+        return jsonify(entry['stats'])
         
-        for rarity, data in rarities.items():
-            if rarity not in skins_by_rarity:
-                continue
-                
-            odds = data["weight"] / total_weight
-            rarities[rarity]["odds"] = odds
-            
-            # Calculate average value for this rarity
-            avg_value = sum(skin['price'] for skin in skins_by_rarity[rarity]) / len(skins_by_rarity[rarity])
-            
-            # Contribute to expected value
-            expected_value += odds * avg_value
-            
-            # Prepare stats for response
-            rarity_stats.append({
-                "rarity": rarity,
-                "odds": round(odds * 100, 4),  # Convert to percentage
-                "count": len(skins_by_rarity[rarity]),
-                "avg_value": round(avg_value, 2)
-            })
-        
-        # Calculate ROI
-        roi = (expected_value / case['price']) - 1
-        roi_percentage = round(roi * 100, 2)
-        
-        return jsonify({
-            "case": serialize_doc(case),
-            "expected_value": round(expected_value, 2),
-            "case_price": case['price'],
-            "roi_percentage": roi_percentage,
-            "rarity_stats": rarity_stats
-        })
+    except Exception as e:
+        return jsonify({"error": str(e)}), 500
+
+@app.route('/api/case-stats')
+def get_all_case_stats():
+    """Stats for every case in one call"""
+    try:
+        return jsonify(stats.get_all_case_stats(db))
         
     except Exception as e:
         return jsonify({"error": str(e)}), 500
 
+# Development server only; production runs under gunicorn (see gunicorn.conf.py)
 if __name__ == '__main__':
     port = int(os.getenv('PORT', 5000))
     app.run(debug=True, host='0.0.0.0', port=port)
\ No newline at end of file
@@ -0,0 +1,101 @@
+"""Benchmark the app under gunicorn's thread and event-loop workers.
+
+Starts gunicorn (gunicorn.conf.py) once per worker class, runs the same
+loadtest scenario against each with the same seed, optionally while
+--slow-clients connections sit on the server, and prints the results side
+by side:
+
+    python api/bench_workers.py -c 32 -n 20 --slow-clients 500
+    python api/bench_workers.py --classes gevent --workers 2 --json
+
+Needs a seeded MONGO_URI database and gunicorn (plus gevent for the gevent
+worker) installed.
+"""
+import argparse
+import json
+import os
+import signal
+import socket
+import subprocess
+import sys
+import time
+
+import loadtest
+
+API_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+def wait_for_port(port, timeout):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            socket.create_connection(('127.0.0.1', port), timeout=1).close()
+            return True
+        except OSError:
+            time.sleep(0.2)
+    return False
+
+
+def bench(worker_class, args):
+    """Run the loadtest against gunicorn with ``worker_class``; returns the report."""
+    env = dict(os.environ, WEB_WORKER_CLASS=worker_class, PORT=str(args.port))
+    if args.workers:
+        env['WEB_CONCURRENCY'] = str(args.workers)
+
+    server = subprocess.Popen([sys.executable, '-m', 'gunicorn'], cwd=API_DIR, env=env)
+    try:
+        if not wait_for_port(args.port, args.startup_timeout):
+            raise RuntimeError(f"gunicorn ({worker_class}) didn't start listening on port {args.port}")
+        url = f'http://127.0.0.1:{args.port}'
+        slow_clients = loadtest.SlowClients(url, args.slow_clients) if args.slow_clients else None
+        return loadtest.run(lambda: loadtest.HttpSession(url), args.concurrency, args.iterations,
+                            args.seed, args.claim_ratio, slow_clients)
+    finally:
+        server.send_signal(signal.SIGTERM)
+        server.wait(timeout=60)
+
+
+def print_comparison(reports):
+    names = list(reports)
+    print(f"  {'':<22}" + ''.join(f"{name:>14}" for name in names))
+    print(f"  {'req/s':<22}" + ''.join(f"{reports[name]['requests_per_second']:>14.1f}" for name in names))
+    print(f"  {'slow clients served':<22}" + ''.join(
+        f"{reports[name]['slow_clients_open']:>10}/{reports[name]['slow_clients']:<3}" for name in names))
+    steps = sorted({step for report in reports.values() for step in report['steps']})
+    for step in steps:
+        for field in ('p50_ms', 'p95_ms', 'errors'):
+            values = [reports[name]['steps'].get(step, {}).get(field, 0) for name in names]
+            print(f"  {step + ' ' + field:<22}" + ''.join(f"{value:>14}" for value in values))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--classes', nargs='+', default=['gthread', 'gevent'], help='worker classes to compare')
+    parser.add_argument('--workers', type=int, help='WEB_CONCURRENCY for every run (default: gunicorn.conf.py)')
+    parser.add_argument('--port', type=int, default=5099, help='port gunicorn listens on')
+    parser.add_argument('--startup-timeout', type=float, default=30, help='seconds to wait for gunicorn')
+    parser.add_argument('-c', '--concurrency', type=int, default=16, help='virtual users running at once')
+    parser.add_argument('-n', '--iterations', type=int, default=20, help='flow iterations per virtual user')
+    parser.add_argument('--seed', type=int, default=1, help='seed for the users and their choices')
+    parser.add_argument('--claim-ratio', type=float, default=0.7, help='share of scans that are claimed')
+    parser.add_argument('--slow-clients', type=int, default=0, metavar='N',
+                        help='connections that never finish their request, held during each run')
+    parser.add_argument('--json', action='store_true', help='print the reports as JSON')
+    args = parser.parse_args()
+
+    reports = {}
+    for worker_class in args.classes:
+        reports[worker_class] = bench(worker_class, args)
+        if not args.json:
+            print(f"{worker_class}:")
+            loadtest.print_report(reports[worker_class])
+
+    if args.json:
+        print(json.dumps(reports, indent=2))
+    else:
+        print("Comparison:")
+        print_comparison(reports)
+
+
+if __name__ == '__main__':
+    main()
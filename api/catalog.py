@@ -0,0 +1,84 @@
+"""Catalog version tracking.
+
+The seeder stamps a new version into ``catalog_meta`` every time it rewrites
+cases/skins. Everything the app derives from the catalog (drop tables, stats,
+prices) is cached per version and rebuilt when the stamp changes.
+"""
+from bson.objectid import ObjectId
+from datetime import datetime
+import os
+import threading
+import time
+
+CATALOG_META_ID = 'catalog'
+
+# How often (seconds) a worker re-reads the version stamp from Mongo
+VERSION_CHECK_INTERVAL = float(os.getenv('CATALOG_VERSION_CHECK_INTERVAL', 5))
+
+_state = {'version': None, 'checked_at': None}
+_lock = threading.Lock()
+
+
+def read_version(db):
+    """Read the current catalog version straight from the database."""
+    meta = db.catalog_meta.find_one({"_id": CATALOG_META_ID}, {"version": 1})
+    return meta['version'] if meta else None
+
+
+def current_version(db):
+    """Return the catalog version, polling Mongo at most once per interval."""
+    now = time.monotonic()
+    checked_at = _state['checked_at']
+    if checked_at is not None and now - checked_at < VERSION_CHECK_INTERVAL:
+        return _state['version']
+
+    version = read_version(db)
+    with _lock:
+        _state['version'] = version
+        _state['checked_at'] = now
+    return version
+
+
+def bump_version(db):
+    """Publish a new catalog version. Called by the seeder after it writes."""
+    version = str(ObjectId())
+    db.catalog_meta.update_one(
+        {"_id": CATALOG_META_ID},
+        {"$set": {"version": version, "updated_at": datetime.now()}},
+        upsert=True
+    )
+    with _lock:
+        _state['version'] = version
+        _state['checked_at'] = time.monotonic()
+    return version
+
+
+class VersionedCache:
+    """Values derived from the catalog, emptied whenever the catalog version changes."""
+
+    def __init__(self):
+        self._version = None
+        self._values = {}
+        self._lock = threading.Lock()
+
+    def get(self, db, key, build):
+        """Return the cached value for ``key``, calling ``build()`` on a miss.
+
+        ``None`` results are not cached.
+        """
+        version = current_version(db)
+
+        with self._lock:
+            if self._version != version:
+                self._version = version
+                self._values = {}
+            if key in self._values:
+                return self._values[key]
+
+        value = build()
+
+        if value is not None:
+            with self._lock:
+                if self._version == version:
+                    self._values[key] = value
+        return value
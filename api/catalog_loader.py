@@ -0,0 +1,106 @@
+"""Reads the seed catalog from the data files used by setup.py.
+
+    data/qualities.json   rarity ladder, lowest first
+    data/weapons.json     weapon titles and types
+    data/cases.jsonl      one case per line: title, release_date, image,
+                          skins and optional knives/gloves
+    data/gloves.json      glove finish images ("★ <glove> | <finish>")
+    knives_output.json    knife finish images, same name/image format
+
+Adding a case means appending one line to cases.jsonl. Knife and glove
+images are looked up by item name in an ``ImageIndex`` built from the two
+name/image files.
+"""
+import json
+import os
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DATA_DIR = os.path.join(ROOT_DIR, 'data')
+
+KNIFE_IMAGES_FILE = os.path.join(ROOT_DIR, 'knives_output.json')
+GLOVE_IMAGES_FILE = os.path.join(DATA_DIR, 'gloves.json')
+
+DEFAULT_RELEASE_DATE = "2013-01-01"
+DEFAULT_CASE_IMAGE = "https://raw.githubusercontent.com/ByMykel/counter-strike-image-tracker/main/static/panorama/images/econ/weapon_cases/crate_community_1_png.png"
+
+# Finish name of a knife with no pattern ("★ Karambit")
+VANILLA = "Vanilla"
+
+
+class CatalogDataError(ValueError):
+    """Raised for malformed seed data files."""
+
+
+def load_json(name):
+    with open(os.path.join(DATA_DIR, name), encoding='utf-8') as f:
+        return json.load(f)
+
+
+def load_qualities():
+    return load_json('qualities.json')
+
+
+def load_weapons():
+    return load_json('weapons.json')
+
+
+def iter_cases(path=None):
+    """Yield cases from cases.jsonl one line at a time, with defaults filled in."""
+    path = path or os.path.join(DATA_DIR, 'cases.jsonl')
+    with open(path, encoding='utf-8') as f:
+        for line_number, line in enumerate(f, 1):
+            line = line.strip()
+            if not line or line.startswith('#'):
+                continue
+            try:
+                case = json.loads(line)
+            except ValueError as e:
+                raise CatalogDataError(f"{path}:{line_number}: {e}")
+            if 'title' not in case or 'skins' not in case:
+                raise CatalogDataError(f"{path}:{line_number}: a case needs a title and skins")
+
+            case.setdefault('release_date', DEFAULT_RELEASE_DATE)
+            case.setdefault('image', DEFAULT_CASE_IMAGE)
+            yield case
+
+
+def item_name(weapon, finish):
+    """Market name of a knife or glove finish, as used in the image files."""
+    if finish == VANILLA:
+        return f"★ {weapon}"
+    return f"★ {weapon} | {finish}"
+
+
+class ImageIndex:
+    """Item name -> image URL, plus the finishes known for each weapon.
+
+    Names can repeat (Doppler phases share one name); the first image wins.
+    """
+
+    def __init__(self):
+        self.images = {}
+        self.finishes = {}
+
+    def add(self, name, image):
+        if name in self.images:
+            return
+        self.images[name] = image
+
+        weapon, _, finish = name.lstrip('★ ').partition(' | ')
+        self.finishes.setdefault(weapon, []).append(finish or VANILLA)
+
+    def load(self, path):
+        with open(path, encoding='utf-8') as f:
+            for record in json.load(f):
+                self.add(record['name'], record['image'])
+        return self
+
+    def get(self, weapon, finish):
+        return self.images.get(item_name(weapon, finish))
+
+    def finishes_of(self, weapon):
+        return self.finishes.get(weapon, [])
+
+
+def load_image_index():
+    return ImageIndex().load(KNIFE_IMAGES_FILE).load(GLOVE_IMAGES_FILE)
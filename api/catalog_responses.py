@@ -0,0 +1,69 @@
+"""Pre-encoded catalog responses (/api/cases and /api/case/<id>).
+
+The catalog only changes when the seeder publishes a new version, so each
+response body is encoded and gzipped once per version. Requests are served
+from those bytes with a strong ETag, and a matching If-None-Match gets a 304
+without touching the database.
+"""
+from collections import namedtuple
+from flask import current_app, request
+import gzip
+import hashlib
+
+import catalog
+import catalog_store
+
+GZIP_LEVEL = 6
+
+# body/gzipped are the response bytes, etag the (unquoted) tag of the plain body
+EncodedBody = namedtuple('EncodedBody', ['body', 'gzipped', 'etag'])
+
+_bodies = catalog.VersionedCache()
+
+
+def encode(obj):
+    body = current_app.json.dumps_bytes(obj) + b'\n'
+    return EncodedBody(
+        body=body,
+        gzipped=gzip.compress(body, GZIP_LEVEL, mtime=0),
+        etag=hashlib.blake2b(body, digest_size=12).hexdigest()
+    )
+
+
+def get_cases(db):
+    """Encoded list of every case."""
+    return _bodies.get(db, 'cases', lambda: encode(catalog_store.get_store(db).cases))
+
+
+def get_case(db, case_oid):
+    """Encoded case with its skins, or None if the case doesn't exist."""
+    def build():
+        store = catalog_store.get_store(db)
+        case = store.case(case_oid)
+        if not case:
+            return None
+        return encode({"case": case, "skins": store.skins_of_case(case_oid)})
+
+    return _bodies.get(db, str(case_oid), build)
+
+
+def send(encoded):
+    """Response for the current request: 304, gzipped or plain body."""
+    # Quality, not presence: "gzip;q=0" means the client refuses it
+    use_gzip = request.accept_encodings['gzip'] > 0
+    # The gzipped body is a different representation, so it gets its own strong tag
+    etag = encoded.etag + '-gz' if use_gzip else encoded.etag
+
+    if request.if_none_match.contains_weak(encoded.etag) or request.if_none_match.contains_weak(encoded.etag + '-gz'):
+        response = current_app.response_class(status=304)
+    else:
+        response = current_app.response_class(encoded.gzipped if use_gzip else encoded.body,
+                                              mimetype='application/json')
+        if use_gzip:
+            response.headers['Content-Encoding'] = 'gzip'
+
+    response.set_etag(etag)
+    response.headers['Vary'] = 'Accept-Encoding'
+    # Browsers revalidate every time; unchanged catalogs come back as 304s
+    response.headers['Cache-Control'] = 'no-cache'
+    return response
@@ -0,0 +1,109 @@
+"""The whole catalog in process memory.
+
+``cases`` and ``skins`` are read once per catalog version into a
+``CatalogStore``; after that every catalog read is a dictionary lookup. The
+drop tables, price book, stats and catalog responses are all compiled from
+it instead of querying Mongo themselves.
+
+Skin documents are kept as they are stored (they go to clients as is), in
+catalog order, and indexed by _id, by case and by rarity. The fields the
+price book and the drop tables compute with are also held once as typed
+columns, one row per skin: market price, float range (NaN when the skin has
+none) and StatTrak™. ``column`` hands them out as NumPy arrays over the same
+memory, so neither keeps a copy of its own.
+"""
+from array import array
+
+try:
+    import numpy as np
+except ImportError:  # Columns are handed out as the arrays themselves
+    np = None
+
+import catalog
+
+# Column name -> array typecode ('b' columns are flags)
+COLUMNS = {'price': 'd', 'min_float': 'd', 'max_float': 'd', 'stattrak': 'b'}
+
+
+def _float_or_nan(value):
+    return float('nan') if value is None else value
+
+
+class CatalogStore:
+    __slots__ = ('cases', 'case_index', 'docs', 'skin_index', 'by_case', 'by_rarity', 'columns')
+
+    def __init__(self, cases, skins):
+        self.cases = list(cases)
+        self.case_index = {case['_id']: case for case in self.cases}
+
+        self.docs = []
+        self.skin_index = {}
+        by_case = {}
+        by_rarity = {}
+        columns = {name: array(typecode) for name, typecode in COLUMNS.items()}
+
+        for row, skin in enumerate(skins):
+            self.docs.append(skin)
+            self.skin_index[skin['_id']] = row
+            columns['price'].append(skin['price'])
+            columns['min_float'].append(_float_or_nan(skin.get('min_float')))
+            columns['max_float'].append(_float_or_nan(skin.get('max_float')))
+            columns['stattrak'].append(bool(skin.get('stattrak', False)))
+            by_case.setdefault(skin['case_id'], array('l')).append(row)
+            by_rarity.setdefault(skin['quality']['title'], array('l')).append(row)
+
+        self.by_case = by_case
+        self.by_rarity = by_rarity
+        self.columns = columns
+
+    def column(self, name):
+        """A typed column, one row per skin: a NumPy array sharing the store's memory when NumPy is available."""
+        column = self.columns[name]
+        if np is None:
+            return column
+        if column.typecode == 'b':
+            return np.frombuffer(column, dtype=np.int8).view(bool)
+        return np.frombuffer(column, dtype=np.float64)
+
+    def case(self, case_id):
+        return self.case_index.get(case_id)
+
+    def skin(self, skin_id):
+        row = self.skin_index.get(skin_id)
+        return None if row is None else self.docs[row]
+
+    def skins_of_case(self, case_id):
+        """Skin documents of a case, in catalog order."""
+        return [self.docs[row] for row in self.by_case.get(case_id, ())]
+
+    def skin_ids(self, rarity=None, case_id=None, q=None):
+        """_ids of the skins matching every given filter (``q``: case-insensitive name substring)."""
+        if case_id is not None:
+            rows = self.by_case.get(case_id, ())
+        elif rarity is not None:
+            rows = self.by_rarity.get(rarity, ())
+        else:
+            rows = range(len(self.docs))
+
+        needle = q.casefold() if q else None
+        ids = []
+        for row in rows:
+            skin = self.docs[row]
+            if rarity is not None and skin['quality']['title'] != rarity:
+                continue
+            if needle and needle not in skin['weapon']['title'].casefold() \
+                    and needle not in skin['pattern']['title'].casefold():
+                continue
+            ids.append(skin['_id'])
+        return ids
+
+
+_stores = catalog.VersionedCache()
+
+
+def get_store(db):
+    """The catalog for the current catalog version."""
+    def build():
+        return CatalogStore(db.cases.find(), db.skins.find())
+
+    return _stores.get(db, 'catalog', build)
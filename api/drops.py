@@ -0,0 +1,257 @@
+"""Compiled per-case drop tables used by the case opening endpoints.
+
+A drop table is built once per case and catalog version: skins are grouped
+into the same categories ``scan_case`` always used, and the rarity weights
+are turned into prefix sums so a roll is a bisect instead of a linear walk.
+"""
+from bisect import bisect_left
+from collections import namedtuple
+from itertools import accumulate
+import os
+import random
+
+from bson.objectid import ObjectId
+
+try:
+    import numpy as np
+except ImportError:  # Bulk opening falls back to rolling one case at a time
+    np = None
+
+import catalog
+import catalog_store
+
+# Adjusted rarity weights - reduced chances for Covert items
+RARITIES = {
+    "Consumer Grade": {"weight": 2800, "float_curve": "normal"},
+    "Industrial Grade": {"weight": 2200, "float_curve": "normal"},
+    "Mil-Spec": {"weight": 1600, "float_curve": "normal"},
+    "Restricted": {"weight": 650, "float_curve": "normal"},
+    "Classified": {"weight": 120, "float_curve": "normal"},
+    "Covert": {"weight": 30, "float_curve": "slightly_right_skewed"},
+    "Exceedingly Rare": {"weight": 15, "float_curve": "left_skewed"}
+}
+
+SPECIAL_ITEM_CHANCE = 0.0015  # Knife drop chance (0.15%)
+STATTRAK_CHANCE = 0.04  # StatTrak™ roll for non-StatTrak skins (4%)
+
+KNIFE_CATEGORY = "Exceedingly Rare_knife"
+
+# Maximum number of cases a single bulk open may draw
+MAX_BULK_OPEN = 100
+
+# Float curve codes used by the vectorized sampler
+FLOAT_CURVES = ("normal", "slightly_right_skewed", "left_skewed")
+
+# Compact reference to a skin; ``doc`` is the full document returned to clients
+SkinRef = namedtuple('SkinRef', ['id', 'min_float', 'max_float', 'stattrak', 'doc'])
+
+
+def scan_fee_for(price):
+    """Scanning fee: 5% of case price, minimum 10 RC."""
+    return round(max(price * 0.05, 10), 2)
+
+
+def roll_float(min_float, max_float, float_curve, rng=random):
+    """Generate a float value for a skin using the rarity's float curve."""
+    float_range = max_float - min_float
+
+    if float_curve == "normal":
+        # Normal distribution centered in the middle of the range
+        mu = min_float + float_range / 2
+        sigma = float_range / 6
+        item_float = rng.normalvariate(mu, sigma)
+        # Ensure the float stays within bounds
+        item_float = max(min_float, min(max_float, item_float))
+    elif float_curve == "slightly_right_skewed":
+        # Beta distribution for slightly right-skewed (more lower floats)
+        item_float = min_float + rng.betavariate(2, 3) * float_range
+    elif float_curve == "left_skewed":
+        # Beta distribution for left-skewed (more higher floats)
+        item_float = min_float + rng.betavariate(3, 2) * float_range
+    else:
+        # Uniform distribution as fallback
+        item_float = rng.uniform(min_float, max_float)
+
+    # Round to 8 decimal places (CS:GO standard)
+    return round(item_float, 8)
+
+
+class DropTable:
+    """Everything needed to open one case without touching the database."""
+
+    __slots__ = ('case', 'price', 'scan_fee', 'categories', 'category_names',
+                 'rarities', 'cumulative', 'total_weight', 'skins_by_id', 'arrays')
+
+    def __init__(self, case, store):
+        self.case = case
+        self.price = case['price']
+        self.scan_fee = scan_fee_for(case['price'])
+
+        # Group skins by rarity, with special categories for knives and gloves
+        categories = {}
+        category_rows = {}
+        skins_by_id = {}
+        for row in store.by_case.get(case['_id'], ()):
+            skin = store.docs[row]
+            weapon_type = skin['weapon']['type']
+            if weapon_type in ("knife", "gloves"):
+                category = f"Exceedingly Rare_{weapon_type}"
+            else:
+                category = skin['quality']['title']
+
+            ref = SkinRef(skin['_id'], skin['min_float'], skin['max_float'],
+                          skin.get('stattrak', False), skin)
+            categories.setdefault(category, []).append(ref)
+            category_rows.setdefault(category, []).append(row)
+            skins_by_id[str(skin['_id'])] = ref
+
+        self.categories = {name: tuple(refs) for name, refs in categories.items()}
+        self.category_names = tuple(self.categories)
+        self.skins_by_id = skins_by_id
+
+        # Prefix sums over the non-special rarities present in this case
+        self.rarities = tuple(r for r in RARITIES if r in self.categories and r != "Exceedingly Rare")
+        self.cumulative = tuple(accumulate(RARITIES[r]["weight"] for r in self.rarities))
+        self.total_weight = self.cumulative[-1] if self.cumulative else 0
+
+        self.arrays = self._compile_arrays(store, category_rows) if np is not None else None
+
+    def _compile_arrays(self, store, category_rows):
+        """Flatten the categories into arrays for the vectorized sampler, gathered from the store's columns."""
+        refs = []
+        rows = []
+        offsets = {}
+        sizes = {}
+        for name, category_refs in self.categories.items():
+            offsets[name] = len(refs)
+            sizes[name] = len(category_refs)
+            refs.extend(category_refs)
+            rows.extend(category_rows[name])
+
+        rows = np.array(rows, dtype=np.int64)
+        return {
+            'refs': refs,
+            'min_float': store.column('min_float')[rows],
+            'max_float': store.column('max_float')[rows],
+            'stattrak': store.column('stattrak')[rows],
+            'cumulative': np.array(self.cumulative, dtype=np.float64),
+            # Per-rarity offsets/sizes/curve codes, indexed like self.rarities
+            'rarity_offset': np.array([offsets[r] for r in self.rarities], dtype=np.int64),
+            'rarity_size': np.array([sizes[r] for r in self.rarities], dtype=np.int64),
+            'rarity_curve': np.array([FLOAT_CURVES.index(RARITIES[r]["float_curve"]) for r in self.rarities], dtype=np.int8),
+            # Per-category offsets/sizes for the no-rarity fallback
+            'category_offset': np.array([offsets[c] for c in self.category_names], dtype=np.int64),
+            'category_size': np.array([sizes[c] for c in self.category_names], dtype=np.int64),
+            'knife_offset': offsets.get(KNIFE_CATEGORY, 0),
+            'knife_size': sizes.get(KNIFE_CATEGORY, 0),
+        }
+
+    @property
+    def is_empty(self):
+        return not self.categories
+
+    def pick(self, rng=random):
+        """Choose a skin and its float curve."""
+        # First, decide if we're dropping a special item (knife)
+        is_special_item = rng.random() < SPECIAL_ITEM_CHANCE
+
+        if is_special_item and KNIFE_CATEGORY in self.categories:
+            return rng.choice(self.categories[KNIFE_CATEGORY]), "left_skewed"
+
+        if not self.rarities:
+            # Fallback if no non-special rarities found
+            category = rng.choice(self.category_names)
+            return rng.choice(self.categories[category]), "normal"
+
+        roll = rng.uniform(0, self.total_weight)
+        index = min(bisect_left(self.cumulative, roll), len(self.rarities) - 1)
+        rarity = self.rarities[index]
+        return rng.choice(self.categories[rarity]), RARITIES[rarity]["float_curve"]
+
+    def open(self, rng=random):
+        """Roll one case: returns (skin ref, float, is_stattrak)."""
+        ref, float_curve = self.pick(rng)
+        item_float = roll_float(ref.min_float, ref.max_float, float_curve, rng)
+        is_stattrak = ref.stattrak or (rng.random() < STATTRAK_CHANCE)
+        return ref, item_float, is_stattrak
+
+    def open_many(self, count, rng=None):
+        """Roll ``count`` cases in one vectorized pass.
+
+        Uses the same special-item roll, rarity prefix sums, float curves and
+        StatTrak™ chance as ``open``. Returns a list of (skin ref, float, is_stattrak).
+        """
+        if self.arrays is None:
+            return [self.open() for _ in range(count)]
+
+        rng = rng or _np_rng
+        arrays = self.arrays
+
+        # Rarity draw (or uniform category draw if the case has no regular rarities)
+        if self.rarities:
+            rolls = rng.uniform(0, self.total_weight, count)
+            rarity_index = np.minimum(np.searchsorted(arrays['cumulative'], rolls, side='left'),
+                                      len(self.rarities) - 1)
+            offset = arrays['rarity_offset'][rarity_index]
+            size = arrays['rarity_size'][rarity_index]
+            curve = arrays['rarity_curve'][rarity_index]
+        else:
+            category_index = rng.integers(0, len(self.category_names), count)
+            offset = arrays['category_offset'][category_index]
+            size = arrays['category_size'][category_index]
+            curve = np.zeros(count, dtype=np.int8)
+
+        # Knife drops override the rarity draw
+        if arrays['knife_size']:
+            special = rng.random(count) < SPECIAL_ITEM_CHANCE
+            offset = np.where(special, arrays['knife_offset'], offset)
+            size = np.where(special, arrays['knife_size'], size)
+            curve = np.where(special, FLOAT_CURVES.index("left_skewed"), curve)
+
+        # Uniform skin choice within the chosen category
+        skin_index = offset + (rng.random(count) * size).astype(np.int64)
+
+        # Floats per curve
+        min_float = arrays['min_float'][skin_index]
+        max_float = arrays['max_float'][skin_index]
+        float_range = max_float - min_float
+
+        normal = np.clip(rng.normal(min_float + float_range / 2, float_range / 6), min_float, max_float)
+        right_skewed = min_float + rng.beta(2, 3, count) * float_range
+        left_skewed = min_float + rng.beta(3, 2, count) * float_range
+        floats = np.round(np.choose(curve, (normal, right_skewed, left_skewed)), 8)
+
+        stattrak = arrays['stattrak'][skin_index] | (rng.random(count) < STATTRAK_CHANCE)
+
+        refs = arrays['refs']
+        return [(refs[i], f, s) for i, f, s in zip(skin_index.tolist(), floats.tolist(), stattrak.tolist())]
+
+
+_np_rng = np.random.default_rng() if np is not None else None
+
+
+def _reseed():
+    global _np_rng
+    if np is not None:
+        _np_rng = np.random.default_rng()
+
+
+# Forked workers must not replay the parent's stream (the random module reseeds itself the same way)
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_reseed)
+
+_tables = catalog.VersionedCache()
+
+
+def get_drop_table(db, case_id):
+    """Return the compiled drop table for a case, or None if the case doesn't exist."""
+    case_oid = ObjectId(case_id)
+
+    def build():
+        store = catalog_store.get_store(db)
+        case = store.case(case_oid)
+        if not case:
+            return None
+        return DropTable(case, store)
+
+    return _tables.get(db, str(case_oid), build)
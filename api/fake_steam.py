@@ -0,0 +1,73 @@
+"""Local stand-in for the Steam Web API's GetPlayerSummaries.
+
+Answers every steam id with a generated persona, optionally slowly or with
+errors, so the login path and the Steam client can be exercised offline:
+
+    python api/fake_steam.py --port 8765 --delay 0.5 --error-rate 0.1
+    STEAM_API_KEY=test STEAM_API_URL=http://127.0.0.1:8765 python api/app.py
+"""
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+import argparse
+import json
+import random
+import time
+
+AVATAR = 'https://steamcdn-a.akamaihd.net/steamcommunity/public/images/avatars/fe/fef49e7fa7e1997310d705b2a6158ff8dc1cdfeb.jpg'
+
+
+def player(steam_id):
+    return {
+        'steamid': steam_id,
+        'personaname': f'Fake_{steam_id[-5:]}',
+        'avatar': AVATAR,
+        'avatarmedium': AVATAR,
+        'avatarfull': AVATAR,
+        'profileurl': f'https://steamcommunity.com/profiles/{steam_id}/'
+    }
+
+
+class FakeSteamHandler(BaseHTTPRequestHandler):
+    delay = 0.0
+    error_rate = 0.0
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        if url.path.rstrip('/') != '/ISteamUser/GetPlayerSummaries/v0002':
+            self.send_error(404)
+            return
+
+        if self.delay:
+            time.sleep(self.delay)
+        if random.random() < self.error_rate:
+            self.send_error(503)
+            return
+
+        steam_ids = parse_qs(url.query).get('steamids', [''])[0].split(',')
+        body = json.dumps({'response': {'players': [player(steam_id) for steam_id in steam_ids[:100] if steam_id]}})
+
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body.encode())
+
+    def log_message(self, format, *args):
+        pass
+
+
+def serve(port=8765, delay=0.0, error_rate=0.0):
+    FakeSteamHandler.delay = delay
+    FakeSteamHandler.error_rate = error_rate
+    server = ThreadingHTTPServer(('127.0.0.1', port), FakeSteamHandler)
+    print(f"Fake Steam API on http://127.0.0.1:{port}")
+    server.serve_forever()
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--delay', type=float, default=0.0, help='seconds to wait before answering')
+    parser.add_argument('--error-rate', type=float, default=0.0, help='fraction of requests answered with 503')
+    args = parser.parse_args()
+    serve(args.port, args.delay, args.error_rate)
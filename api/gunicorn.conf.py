@@ -0,0 +1,89 @@
+"""gunicorn settings: the production entry point.
+
+    cd api && gunicorn            # reads this file, serves app:app on $PORT
+
+The master process loads and compiles the catalog once (see preload.py) and
+then forks the workers, which share it copy-on-write. Each worker imports
+the app after the fork and opens its own MongoDB connections.
+
+Scaling:
+  * WEB_WORKER_CLASS=gthread (default): WEB_CONCURRENCY processes (default:
+    one per core), each running WEB_THREADS request threads (default 8).
+    Requests mostly wait on Mongo, so the threads provide concurrency and the
+    processes use the cores.
+  * WEB_WORKER_CLASS=gevent: one process per core, each with up to
+    WEB_WORKER_CONNECTIONS greenlets (default 200). This suits many slow
+    clients or long Steam calls. The routes are the same code: gevent
+    patches pymongo's and requests' sockets. bench_workers.py compares the
+    two classes.
+  * MONGO_MAX_POOL_SIZE defaults to what one worker can use at once: its
+    threads plus a few for background jobs. Under gevent it is capped at 50,
+    and further greenlets queue for a connection. mongod sees workers x pool
+    connections, so keep that under its connection limit.
+  * For more machines, run more copies behind a load balancer. No sticky
+    sessions are needed: sessions are signed cookies and scan tickets live
+    in Mongo.
+
+Caches and /metrics are per process: a scrape reports the worker that
+answered it.
+"""
+import multiprocessing
+import os
+import sys
+
+WORKER_CLASS = os.getenv('WEB_WORKER_CLASS', 'gthread')
+
+if WORKER_CLASS == 'gevent':
+    # Patch before pymongo/ssl are imported by the preload below
+    from gevent import monkey
+    monkey.patch_all()
+
+from dotenv import load_dotenv
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+# Load environment variables
+load_dotenv()
+
+mongo_uri = os.getenv('MONGO_URI', 'mongodb://localhost:27017/')
+mongo_db = os.getenv('MONGO_DB', 'csgo_cases_db')
+
+# Connections a worker needs besides its request handlers (profile refresher, pool monitor)
+BACKGROUND_CONNECTIONS = 4
+GEVENT_MAX_POOL_SIZE = 50
+
+wsgi_app = 'app:app'
+bind = f"0.0.0.0:{os.getenv('PORT', 5000)}"
+worker_class = WORKER_CLASS
+workers = int(os.getenv('WEB_CONCURRENCY', multiprocessing.cpu_count()))
+threads = int(os.getenv('WEB_THREADS', 8))
+worker_connections = int(os.getenv('WEB_WORKER_CONNECTIONS', 200))
+timeout = 30
+graceful_timeout = 30
+keepalive = 5
+
+# Recycle workers now and then, staggered so they don't all restart at once
+max_requests = 10000
+max_requests_jitter = 1000
+
+# Not the app itself: its MongoClient must be created after the fork
+preload_app = False
+
+if worker_class == 'gevent':
+    os.environ.setdefault('MONGO_MAX_POOL_SIZE', str(min(worker_connections, GEVENT_MAX_POOL_SIZE)))
+else:
+    os.environ.setdefault('MONGO_MAX_POOL_SIZE', str(threads + BACKGROUND_CONNECTIONS))
+
+
+def on_starting(server):
+    """Compile the catalog in the master, before any worker is forked."""
+    import preload
+
+    try:
+        version, cases = preload.preload(mongo_uri, mongo_db)
+    except Exception as e:
+        # Workers still build the caches on demand
+        server.log.warning("Catalog preload failed, workers will build it themselves: %s", e)
+        return
+    server.log.info("Preloaded catalog version %s (%d cases), MONGO_MAX_POOL_SIZE=%s per worker",
+                    version, cases, os.environ['MONGO_MAX_POOL_SIZE'])
@@ -0,0 +1,186 @@
+"""Index definitions for every collection, plus a query-plan check.
+
+The seeder and the app both call ``ensure_indexes`` on startup (creating an
+index that already exists is a no-op). To verify that every query shape the
+endpoints use is served by an index:
+
+    python api/indexes.py            # create indexes
+    python api/indexes.py --check    # create, then explain() every query shape
+
+``--check`` exits with status 1 if any winning plan contains a COLLSCAN.
+
+An index that can't be built (e.g. the unique steam_id index over duplicate
+users, see migrate_inventory.py) is logged and skipped, so the app still
+starts; the command line exits with status 1 instead.
+"""
+from bson.objectid import ObjectId
+from datetime import datetime
+from pymongo import ASCENDING, DESCENDING, MongoClient
+from pymongo.errors import OperationFailure
+from dotenv import load_dotenv
+import argparse
+import logging
+import os
+import sys
+
+import inventory
+
+logger = logging.getLogger(__name__)
+
+# Load environment variables
+load_dotenv()
+
+mongo_uri = os.getenv('MONGO_URI', 'mongodb://localhost:27017/')
+mongo_db = os.getenv('MONGO_DB', 'csgo_cases_db')
+
+# collection -> [(keys, options)]
+INDEXES = {
+    "users": [
+        ([("steam_id", ASCENDING)], {"name": "steam_id_unique", "unique": True}),
+        # Profile refresher: never refreshed first, then oldest
+        ([("profile_refreshed_at", ASCENDING)], {}),
+    ],
+    "skins": [
+        ([("case_id", ASCENDING)], {}),
+    ],
+    "inventory_items": [
+        ([("steam_id", ASCENDING), ("obtained_at", DESCENDING), ("_id", DESCENDING)], {}),
+        ([("steam_id", ASCENDING), ("float", ASCENDING), ("_id", ASCENDING)], {}),
+        # Price and rarity sorts use the skin fields copied onto each item
+        ([("steam_id", ASCENDING), ("price", ASCENDING), ("_id", ASCENDING)], {}),
+        ([("steam_id", ASCENDING), ("rarity", ASCENDING), ("_id", ASCENDING)], {}),
+        # Reseeds copy a repriced skin's fields onto its items
+        ([("skin_id", ASCENDING)], {}),
+        # Only items reserved by a sale in progress carry a sale_id
+        ([("sale_id", ASCENDING)], {"sparse": True}),
+        # A user's reservations whose lease has passed (sales.recover)
+        ([("steam_id", ASCENDING), ("reserved_until", ASCENDING)],
+         {"partialFilterExpression": {"sale_id": {"$exists": True}}}),
+    ],
+    "scan_tickets": [
+        # Mongo drops tickets once expires_at has passed
+        ([("expires_at", ASCENDING)], {"expireAfterSeconds": 0}),
+        ([("steam_id", ASCENDING), ("case_id", ASCENDING), ("expires_at", DESCENDING)], {}),
+    ],
+}
+
+
+def ensure_indexes(db):
+    """Create every index; returns the (collection, keys) of the ones that failed to build."""
+    failed = []
+    for collection, indexes in INDEXES.items():
+        for keys, options in indexes:
+            try:
+                db[collection].create_index(keys, **options)
+            except OperationFailure as e:
+                logger.error("Could not build index %s on %s: %s", keys, collection, e)
+                failed.append((collection, keys))
+    return failed
+
+
+def query_shapes():
+    """(name, collection, filter or pipeline, sort) for every query the endpoints run.
+
+    Values are placeholders; only the shape matters to the planner. Whole
+    catalog reads (cached once per catalog version) scan by design and are
+    not listed.
+    """
+    steam_id = '0'
+    oid = ObjectId()
+
+    shapes = [
+        ("user by steam_id", "users", {"steam_id": steam_id}, None),
+        ("user by _id", "users", {"_id": oid}, None),
+        ("users never refreshed", "users", {"profile_refreshed_at": None}, None),
+        ("users with stale profiles", "users", {"profile_refreshed_at": {"$lt": datetime.now()}},
+         [("profile_refreshed_at", ASCENDING)]),
+        ("catalog version", "catalog_meta", {"_id": "catalog"}, None),
+        ("inventory, oldest first", "inventory_items", {"steam_id": steam_id},
+         [("obtained_at", ASCENDING), ("_id", ASCENDING)]),
+        ("inventory item", "inventory_items", {"_id": oid, "steam_id": steam_id}, None),
+        ("inventory items by _id list", "inventory_items", {"_id": {"$in": [oid]}, "steam_id": steam_id}, None),
+        ("inventory filtered by skins", "inventory_items", {"steam_id": steam_id, "skin_id": {"$in": [oid]}},
+         [("obtained_at", DESCENDING), ("_id", DESCENDING)]),
+        ("items of a skin", "inventory_items", {"skin_id": oid}, None),
+        ("items reserved by a sale", "inventory_items", {"sale_id": oid}, None),
+        ("expired sale reservations of a user", "inventory_items",
+         {"steam_id": steam_id, "sale_id": {"$exists": True}, "reserved_until": {"$lt": datetime.now()}}, None),
+        ("scan ticket", "scan_tickets", {"_id": "ticket", "expires_at": {"$gt": datetime.now()}}, None),
+        ("latest scan ticket of a case", "scan_tickets",
+         {"steam_id": steam_id, "case_id": str(oid), "expires_at": {"$gt": datetime.now()}},
+         [("expires_at", DESCENDING)]),
+        ("scan tickets of a user", "scan_tickets", {"steam_id": steam_id}, None),
+    ]
+
+    # Every sort/order of the paginated inventory, first page and with a cursor
+    for sort in inventory.SORT_FIELDS:
+        for order in ('asc', 'desc'):
+            for cursor in (None, (0, oid)):
+                pipeline = inventory.page_pipeline(steam_id, sort, order, cursor=cursor)
+                label = f"inventory page by {sort} {order}" + (" after cursor" if cursor else "")
+                shapes.append((label, "inventory_items", pipeline, None))
+
+    return shapes
+
+
+def _has_collscan(plan):
+    if isinstance(plan, dict):
+        return plan.get('stage') == 'COLLSCAN' or any(_has_collscan(value) for value in plan.values())
+    if isinstance(plan, list):
+        return any(_has_collscan(value) for value in plan)
+    return False
+
+
+def _winning_plans(explain):
+    """Every winningPlan in an explain() result (aggregations and shards nest them)."""
+    if isinstance(explain, dict):
+        plans = [explain['winningPlan']] if 'winningPlan' in explain else []
+        for key, value in explain.items():
+            if key != 'winningPlan':
+                plans += _winning_plans(value)
+        return plans
+    if isinstance(explain, list):
+        return [plan for value in explain for plan in _winning_plans(value)]
+    return []
+
+
+def explain(db, collection, query, sort=None):
+    if isinstance(query, list):
+        return db.command('aggregate', collection, pipeline=query, explain=True)
+    cursor = db[collection].find(query)
+    if sort:
+        cursor = cursor.sort(sort)
+    return cursor.explain()
+
+
+def check(db):
+    """Explain every query shape; returns the names of the ones that COLLSCAN."""
+    failures = []
+    for name, collection, query, sort in query_shapes():
+        plans = _winning_plans(explain(db, collection, query, sort))
+        if any(_has_collscan(plan) for plan in plans):
+            failures.append(name)
+            print(f"COLLSCAN  {collection:<16} {name}")
+        else:
+            print(f"ok        {collection:<16} {name}")
+    return failures
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--check', action='store_true', help='explain() every query shape, fail on COLLSCAN')
+    args = parser.parse_args()
+
+    db = MongoClient(mongo_uri)[mongo_db]
+    failed = ensure_indexes(db)
+    if failed:
+        for collection, keys in failed:
+            print(f"FAILED    {collection:<16} {keys}")
+        sys.exit(1)
+    print("Indexes are up to date")
+
+    if args.check:
+        failures = check(db)
+        if failures:
+            print(f"{len(failures)} query shape(s) fall back to a collection scan")
+            sys.exit(1)
@@ -0,0 +1,358 @@
+"""Inventory storage and server-side sorted, cursor-paginated queries.
+
+Inventory items live in their own ``inventory_items`` collection, one document
+per item keyed by the owner's ``steam_id``, instead of an array embedded in the
+user document. ``migrate_user`` moves a legacy embedded array over.
+
+Pages are keyset-paginated: the cursor carries the sort value and ``_id`` of
+the last item returned, so fetching page N never skips over pages 1..N-1.
+The skin's price and rarity order are copied onto each item, so every sort
+is served by a (steam_id, field, _id) index; skins are attached from the
+in-memory catalog and skin filters become a ``skin_id`` list. A page only
+touches the items on it.
+
+The totals shown with the first page (count, market and sell value) are
+counters on the user document, moved by the same write that moves the
+balance (see ``totals_delta``). ``recount`` recomputes them, and
+``recount_all`` marks every user for a recount on their next inventory view.
+
+Items reserved by a sale in progress (see sales.py) carry a ``sale_id`` and
+are left out of listings.
+"""
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from datetime import datetime
+
+from bson import json_util
+from bson.objectid import ObjectId
+from pymongo import ASCENDING, UpdateMany, UpdateOne
+
+import catalog_store
+import pricing
+import wallet
+from ttl_cache import TTLCache
+
+DEFAULT_PAGE_SIZE = 24
+MAX_PAGE_SIZE = 100
+
+# Sort name -> field of the inventory item (price and rarity are copied from the skin)
+SORT_FIELDS = {
+    'obtained_at': 'obtained_at',
+    'float': 'float',
+    'price': 'price',
+    'rarity': 'rarity',
+}
+
+# Per-user inventory totals kept on the user document
+TOTAL_FIELDS = ('inventory_count', 'inventory_value', 'inventory_sell_value')
+
+# Set by a full count; until then $inc'd totals of older users are partial and get recounted
+COUNTED_FIELD = 'inventory_counted'
+
+# Bumped by every $inc of the totals, so a recount can tell it raced one
+REVISION_FIELD = 'inventory_revision'
+RECOUNT_ATTEMPTS = 3
+
+# Users this process has seen without a legacy embedded inventory (nothing writes one any more)
+_migrated = TTLCache(3600, 10000)
+
+# Items not reserved by a sale
+UNRESERVED = {"sale_id": {"$exists": False}}
+
+
+def empty_totals():
+    """Totals of a brand new user."""
+    return dict({field: 0 for field in TOTAL_FIELDS}, **{COUNTED_FIELD: True})
+
+
+class InvalidQuery(ValueError):
+    """Raised for malformed pagination/sort/filter parameters."""
+
+
+def encode_cursor(value, item_id):
+    payload = json_util.dumps([value, item_id])
+    return urlsafe_b64encode(payload.encode()).decode()
+
+
+def decode_cursor(cursor):
+    try:
+        value, item_id = json_util.loads(urlsafe_b64decode(cursor.encode()).decode())
+        return value, ObjectId(item_id)
+    except Exception:
+        raise InvalidQuery("Invalid cursor")
+
+
+def parse_query(args):
+    """Validate request args into keyword arguments for ``find_page``."""
+    sort = args.get('sort', 'obtained_at')
+    if sort not in SORT_FIELDS:
+        raise InvalidQuery(f"Unknown sort: {sort}")
+
+    order = args.get('order', 'desc')
+    if order not in ('asc', 'desc'):
+        raise InvalidQuery(f"Unknown order: {order}")
+
+    try:
+        limit = int(args.get('limit', DEFAULT_PAGE_SIZE))
+    except ValueError:
+        raise InvalidQuery("Invalid limit")
+    limit = max(1, min(limit, MAX_PAGE_SIZE))
+
+    cursor = args.get('cursor')
+
+    filters = {}
+    if args.get('q'):
+        filters['q'] = args['q']
+    if args.get('rarity'):
+        filters['rarity'] = args['rarity']
+    if args.get('stattrak') in ('true', 'false'):
+        filters['stattrak'] = args['stattrak'] == 'true'
+    if args.get('case_id'):
+        try:
+            filters['case_id'] = ObjectId(args['case_id'])
+        except Exception:
+            raise InvalidQuery("Invalid case_id")
+
+    return {
+        'sort': sort,
+        'order': order,
+        'limit': limit,
+        'cursor': decode_cursor(cursor) if cursor else None,
+        'filters': filters,
+    }
+
+
+def _item_match(filters):
+    match = {}
+    if 'stattrak' in filters:
+        match['is_stattrak'] = True if filters['stattrak'] else {"$ne": True}
+    if 'skin_ids' in filters:
+        match['skin_id'] = {"$in": filters['skin_ids']}
+    return match
+
+
+def _cursor_match(field, direction, cursor):
+    value, item_id = cursor
+    op = '$lt' if direction < 0 else '$gt'
+    return {"$or": [
+        {field: {op: value}},
+        {field: value, "_id": {op: item_id}},
+    ]}
+
+
+def skin_fields(skin):
+    """The skin fields copied onto its inventory items (kept in sync by ``sync_skin_fields``)."""
+    return {"price": skin['price'], "rarity": skin['quality'].get('order', 0)}
+
+
+def new_item(steam_id, skin, item_float, is_stattrak=False, obtained_at=None):
+    """Build an inventory_items document for a skin document."""
+    item = {
+        "_id": ObjectId(),
+        "steam_id": steam_id,
+        "skin_id": skin['_id'],
+        "float": item_float,
+        "obtained_at": obtained_at or datetime.now()
+    }
+    item.update(skin_fields(skin))
+
+    # Add StatTrak™ if applicable
+    if is_stattrak:
+        item["is_stattrak"] = True
+
+    return item
+
+
+def find_all(db, steam_id):
+    """Every item of a user, oldest first (the order the embedded array had)."""
+    return db.inventory_items.find(dict(UNRESERVED, steam_id=steam_id)).sort([("obtained_at", ASCENDING), ("_id", ASCENDING)])
+
+
+def count(db, steam_id):
+    return db.inventory_items.count_documents(dict(UNRESERVED, steam_id=steam_id))
+
+
+def page_pipeline(steam_id, sort='obtained_at', order='desc', limit=DEFAULT_PAGE_SIZE,
+                  cursor=None, filters=None):
+    """Aggregation pipeline for one page; fetches ``limit + 1`` items to detect a next page.
+
+    ``filters`` are item filters: ``stattrak`` and ``skin_ids`` (see ``find_page``).
+    """
+    field = SORT_FIELDS[sort]
+    direction = -1 if order == 'desc' else 1
+
+    match = dict(UNRESERVED, steam_id=steam_id)
+    match.update(_item_match(filters or {}))
+    if cursor:
+        match.update(_cursor_match(field, direction, cursor))
+
+    return [
+        {"$match": match},
+        {"$sort": {field: direction, "_id": direction}},
+        {"$limit": limit + 1},
+    ]
+
+
+def find_page(db, steam_id, sort='obtained_at', order='desc', limit=DEFAULT_PAGE_SIZE,
+              cursor=None, filters=None):
+    """Return (items, next_cursor) for one page of a user's inventory.
+
+    Each returned item is the stored inventory entry with its skin document
+    joined in under ``skin``. Items whose skin no longer exists are skipped.
+    """
+    field = SORT_FIELDS[sort]
+    store = catalog_store.get_store(db)
+    filters = dict(filters or {})
+
+    # Skin filters become the list of matching skins, from the in-memory catalog
+    if any(key in filters for key in ('rarity', 'case_id', 'q')):
+        filters['skin_ids'] = store.skin_ids(filters.pop('rarity', None), filters.pop('case_id', None),
+                                             filters.pop('q', None))
+
+    items = list(db.inventory_items.aggregate(page_pipeline(steam_id, sort, order, limit, cursor, filters)))
+
+    next_cursor = None
+    if len(items) > limit:
+        items = items[:limit]
+        last = items[-1]
+        next_cursor = encode_cursor(last.get(field), last['_id'])
+
+    page = []
+    for item in items:
+        item['skin'] = store.skin(item['skin_id'])
+        if item['skin']:
+            page.append(item)
+    return page, next_cursor
+
+
+def totals_delta(price_book, items, sign=1):
+    """``$inc`` for the user's totals when ``items`` are added (sign=1) or removed (sign=-1)."""
+    items = [item for item in items if item['skin_id'] in price_book]
+    return {
+        "inventory_count": sign * len(items),
+        "inventory_value": sign * price_book.market_value(items),
+        "inventory_sell_value": sign * sum(price_book.sell_prices(items)),
+        REVISION_FIELD: 1,
+    }
+
+
+def _totals(price_book, items):
+    return {field: round(totals_delta(price_book, items)[field], 2) for field in TOTAL_FIELDS}
+
+
+def recount(db, steam_id):
+    """Recompute one user's totals from their items; returns them, or None without a user.
+
+    The totals are only stored (and the user marked counted) if no ``$inc``
+    landed while the items were read; otherwise the count is retried.
+    """
+    price_book = pricing.get_price_book(db)
+    for _ in range(RECOUNT_ATTEMPTS):
+        user = db.users.find_one({"steam_id": steam_id}, {REVISION_FIELD: 1, wallet.SETTLED_SALES: 1})
+        if user is None:
+            return None
+        items = list(db.inventory_items.find(
+            {"steam_id": steam_id, "sale_id": {"$nin": user.get(wallet.SETTLED_SALES, [])}},
+            {"_id": 0, "skin_id": 1, "float": 1, "is_stattrak": 1, "special_pattern": 1}
+        ))
+        totals = _totals(price_book, items)
+        stored = db.users.update_one(
+            {"steam_id": steam_id, REVISION_FIELD: user.get(REVISION_FIELD)},
+            {"$set": dict(totals, **{COUNTED_FIELD: True})}
+        )
+        if stored.matched_count:
+            break
+    # Still racing after every attempt: show this count, store it next time
+    return totals
+
+
+def recount_all(db):
+    """Mark every user's totals for a recount (after a reseed changes prices); returns how many.
+
+    Nothing is computed here: ``summarize`` recounts each user on their next
+    inventory view, guarded against the writes of a live site.
+    """
+    return db.users.update_many({COUNTED_FIELD: True}, {"$set": {COUNTED_FIELD: False}}).modified_count
+
+
+def sync_skin_fields(db, skins):
+    """Copy the current price and rarity of ``skins`` onto their inventory items."""
+    operations = [UpdateMany({"skin_id": skin['_id']}, {"$set": skin_fields(skin)}) for skin in skins]
+    if operations:
+        db.inventory_items.bulk_write(operations, ordered=False)
+    return len(operations)
+
+
+def backfill_skin_fields(db):
+    """Copy skin fields onto items stored before they were denormalized; returns how many."""
+    store = catalog_store.get_store(db)
+    operations = []
+    for item in db.inventory_items.find({"price": {"$exists": False}}, {"skin_id": 1}):
+        skin = store.skin(item['skin_id'])
+        if skin:
+            operations.append(UpdateOne({"_id": item['_id']}, {"$set": skin_fields(skin)}))
+    if operations:
+        db.inventory_items.bulk_write(operations, ordered=False)
+    return len(operations)
+
+
+def summarize(db, steam_id):
+    """Item count, market value and sell value of a user's whole inventory, or None without a user."""
+    user = db.users.find_one({"steam_id": steam_id}, {field: 1 for field in TOTAL_FIELDS + (COUNTED_FIELD,)})
+    if user is None:
+        return None
+    if not user.get(COUNTED_FIELD):
+        # Users from before the counters existed, or after a reseed, are counted once
+        user = recount(db, steam_id)
+        if user is None:
+            return None
+    return {
+        "total_count": user['inventory_count'],
+        "total_value": round(user['inventory_value'], 2),
+        "total_sell_value": round(user['inventory_sell_value'], 2),
+    }
+
+
+def migrate_user(db, steam_id):
+    """Move a user's embedded ``users.inventory`` array into inventory_items.
+
+    Safe to run while the app is serving: items are upserted by their
+    existing ``_id`` (so reruns are no-ops) and only the migrated ids are
+    pulled from the array afterwards. Returns the number of items moved.
+    """
+    user = db.users.find_one({"steam_id": steam_id}, {"inventory": 1})
+    if not user or not user.get('inventory'):
+        return 0
+
+    items = user['inventory']
+    store = catalog_store.get_store(db)
+    operations = []
+    for item in items:
+        document = {key: value for key, value in item.items() if key != '_id'}
+        document['steam_id'] = steam_id
+        if not isinstance(document['skin_id'], ObjectId):
+            document['skin_id'] = ObjectId(document['skin_id'])
+        skin = store.skin(document['skin_id'])
+        if skin:
+            document.update(skin_fields(skin))
+        operations.append(UpdateOne({"_id": item['_id']}, {"$setOnInsert": document}, upsert=True))
+
+    db.inventory_items.bulk_write(operations, ordered=False)
+    db.users.update_one(
+        {"_id": user['_id']},
+        {"$pull": {"inventory": {"_id": {"$in": [item['_id'] for item in items]}}}}
+    )
+    recount(db, steam_id)
+    return len(items)
+
+
+def ensure_migrated(db, steam_id):
+    """Migrate the user's legacy embedded inventory, if any, before it is read or sold from.
+
+    After the first check a process only asks Mongo again once the user falls
+    out of its cache. Returns the number of items moved.
+    """
+    if _migrated.get(steam_id):
+        return 0
+    moved = migrate_user(db, steam_id)
+    _migrated.set(steam_id, True)
+    return moved
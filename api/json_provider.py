@@ -0,0 +1,45 @@
+"""JSON provider that encodes MongoDB documents in a single pass.
+
+ObjectIds become strings and datetimes ISO 8601 strings during encoding, so
+endpoints can hand raw documents to ``jsonify`` without copying them first.
+orjson is used when it is installed; otherwise the stdlib encoder.
+"""
+from datetime import datetime
+import json
+
+from bson.objectid import ObjectId
+from flask.json.provider import JSONProvider
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _default(obj):
+    if isinstance(obj, ObjectId):
+        return str(obj)
+    if isinstance(obj, datetime):
+        return obj.isoformat()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+class MongoJSONProvider(JSONProvider):
+    sort_keys = True
+
+    def dumps(self, obj, **kwargs):
+        return self.dumps_bytes(obj).decode('utf-8')
+
+    def dumps_bytes(self, obj):
+        if orjson is not None:
+            return orjson.dumps(obj, default=_default, option=orjson.OPT_SORT_KEYS if self.sort_keys else 0)
+        return json.dumps(obj, default=_default, sort_keys=self.sort_keys, separators=(',', ':')).encode('utf-8')
+
+    def loads(self, s, **kwargs):
+        if orjson is not None:
+            return orjson.loads(s)
+        return json.loads(s)
+
+    def response(self, *args, **kwargs):
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(self.dumps_bytes(obj) + b'\n', mimetype='application/json')
@@ -0,0 +1,331 @@
+"""Load generator replaying the site's user flows.
+
+Every virtual user logs in through the (unverified) OpenID callback, adds
+funds like the profile page, then loops over what the pages do: load
+/api/user and /api/cases, scan a case, claim or discard it, page through
+the inventory and sell one item or a batch. Latency is recorded per step.
+
+    python api/loadtest.py --url http://127.0.0.1:5000 -c 16 -n 50
+    python api/loadtest.py --in-memory -c 8 -n 20      # app + mongomock in-process
+    python api/loadtest.py --in-process -c 8 -n 20     # app in-process, MONGO_URI database
+
+``--slow-clients N`` (with --url) also keeps N connections open that send
+their request a header at a time and never finish it, like slow mobile
+clients: a thread-per-request server gives each of them a thread, an event
+loop only a socket (see bench_workers.py).
+
+Runs are reproducible for a given --seed. ``--save-baseline FILE`` stores
+the report; ``--baseline FILE`` compares against one and exits 1 if any
+step's p95 got more than --tolerance slower.
+"""
+from concurrent.futures import ThreadPoolExecutor
+import argparse
+import contextlib
+import json
+import math
+import os
+import random
+import socket
+import sys
+import threading
+import time
+from urllib.parse import urlsplit
+
+import requests
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+STEAM_ID_PREFIX = '7656119'
+STARTING_FUNDS = 1000000
+PAGE_SIZE = 24
+
+
+class HttpSession:
+    """One virtual user's cookie session against a running server."""
+
+    def __init__(self, base_url):
+        self.base_url = base_url.rstrip('/')
+        self.session = requests.Session()
+
+    def request(self, method, path, body=None):
+        response = self.session.request(method, self.base_url + path, json=body, allow_redirects=False, timeout=30)
+        return response.status_code, _json(response.content)
+
+
+class TestClientSession:
+    """One virtual user's session against the app imported in this process."""
+
+    def __init__(self, app):
+        self.client = app.test_client()
+
+    def request(self, method, path, body=None):
+        response = self.client.open(path, method=method, json=body)
+        return response.status_code, _json(response.data)
+
+
+class SlowClients:
+    """``count`` connections trickling in a request that never completes."""
+
+    def __init__(self, base_url, count, interval=2.0):
+        url = urlsplit(base_url)
+        self.address = (url.hostname, url.port or 80)
+        self.host = url.netloc
+        self.count = count
+        self.interval = interval
+        self.sockets = []
+        self._stop = threading.Event()
+        self._thread = None
+
+    def start(self):
+        for _ in range(self.count):
+            try:
+                sock = socket.create_connection(self.address, timeout=5)
+                sock.sendall(f'GET /api/cases HTTP/1.1\r\nHost: {self.host}\r\n'.encode())
+            except OSError:
+                break
+            self.sockets.append(sock)
+        self._thread = threading.Thread(target=self._trickle, daemon=True)
+        self._thread.start()
+        return self
+
+    def _trickle(self):
+        while not self._stop.wait(self.interval):
+            for sock in list(self.sockets):
+                try:
+                    sock.sendall(b'X-Slow: 1\r\n')
+                except OSError:
+                    self.sockets.remove(sock)
+
+    def stop(self):
+        """Close every connection; returns how many the server kept open until the end."""
+        self._stop.set()
+        if self._thread:
+            self._thread.join()
+        still_open = len(self.sockets)
+        for sock in self.sockets:
+            sock.close()
+        self.sockets = []
+        return still_open
+
+
+def _json(content):
+    try:
+        return json.loads(content)
+    except ValueError:
+        return None
+
+
+class VirtualUser:
+    def __init__(self, session, steam_id, rng, claim_ratio, timings):
+        self.session = session
+        self.steam_id = steam_id
+        self.rng = rng
+        self.claim_ratio = claim_ratio
+        self.timings = timings
+        self.errors = {}
+
+    def step(self, name, method, path, body=None, expected=(200,)):
+        started = time.perf_counter()
+        try:
+            status, data = self.session.request(method, path, body)
+        except requests.RequestException:
+            status, data = None, None
+        self.timings.setdefault(name, []).append(time.perf_counter() - started)
+        if status not in expected:
+            self.errors[name] = self.errors.get(name, 0) + 1
+            return None
+        return data if data is not None else {}
+
+    def login(self):
+        # Same callback Steam redirects to; the claimed id is taken as is
+        claimed_id = f'https://steamcommunity.com/openid/id/{self.steam_id}'
+        self.step('login', 'GET', f'/api/auth?openid.signed=1&openid.claimed_id={claimed_id}', expected=(302,))
+        self.step('add_funds', 'POST', '/api/add-funds', {"amount": STARTING_FUNDS})
+
+    def iteration(self):
+        # Cases page
+        self.step('user', 'GET', '/api/user')
+        cases = self.step('cases', 'GET', '/api/cases') or []
+        if not cases:
+            return
+
+        case = self.rng.choice(cases)
+        self.step('case', 'GET', f"/api/case/{case['_id']}")
+        scanned = self.step('scan', 'POST', f"/api/scan-case/{case['_id']}", {})
+        if scanned:
+            if self.rng.random() < self.claim_ratio:
+                self.step('claim', 'POST', f"/api/claim-scanned-case/{case['_id']}", {"ticket": scanned.get('ticket')})
+            else:
+                self.step('discard', 'POST', '/api/discard-case', {"ticket": scanned.get('ticket')})
+
+        # Inventory page
+        self.step('user', 'GET', '/api/user')
+        page = self.step('inventory', 'GET', f'/api/inventory?limit={PAGE_SIZE}&sort=obtained_at&order=desc')
+        items = (page or {}).get('items', [])
+        if not items:
+            return
+
+        if len(items) >= 4 and self.rng.random() < 0.25:
+            batch = [item['_id'] for item in self.rng.sample(items, len(items) // 2)]
+            self.step('sell_items', 'POST', '/api/sell-items', {"item_ids": batch})
+        elif self.rng.random() < 0.5:
+            self.step('sell_item', 'POST', f"/api/sell-item/{self.rng.choice(items)['_id']}", {})
+
+
+def percentile(sorted_values, fraction):
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return 0.0
+    index = max(0, min(len(sorted_values) - 1, math.ceil(fraction * len(sorted_values)) - 1))
+    return sorted_values[index]
+
+
+def run(make_session, users, iterations, seed, claim_ratio, slow_clients=None):
+    def run_user(index):
+        steam_id = f'{STEAM_ID_PREFIX}{seed % 10000:04d}{index:06d}'
+        user = VirtualUser(make_session(), steam_id, random.Random(f'{seed}:{index}'), claim_ratio, {})
+        user.login()
+        for _ in range(iterations):
+            user.iteration()
+        return user
+
+    if slow_clients:
+        slow_clients.start()
+    started = time.perf_counter()
+    try:
+        with ThreadPoolExecutor(max_workers=users) as pool:
+            finished = list(pool.map(run_user, range(users)))
+    finally:
+        elapsed = time.perf_counter() - started
+        slow_open = slow_clients.stop() if slow_clients else 0
+
+    timings = {}
+    errors = {}
+    for user in finished:
+        for name, values in user.timings.items():
+            timings.setdefault(name, []).extend(values)
+        for name, count in user.errors.items():
+            errors[name] = errors.get(name, 0) + count
+
+    steps = {}
+    for name, values in sorted(timings.items()):
+        values.sort()
+        steps[name] = {
+            "requests": len(values),
+            "errors": errors.get(name, 0),
+            "p50_ms": round(percentile(values, 0.50) * 1000, 2),
+            "p95_ms": round(percentile(values, 0.95) * 1000, 2),
+            "p99_ms": round(percentile(values, 0.99) * 1000, 2),
+        }
+
+    total_requests = sum(step["requests"] for step in steps.values())
+    return {
+        "users": users,
+        "iterations": iterations,
+        "seed": seed,
+        "elapsed_seconds": round(elapsed, 3),
+        "requests": total_requests,
+        "requests_per_second": round(total_requests / elapsed, 1) if elapsed else 0.0,
+        "slow_clients": slow_clients.count if slow_clients else 0,
+        "slow_clients_open": slow_open,
+        "steps": steps,
+    }
+
+
+def print_report(report):
+    print(f"{report['users']} users x {report['iterations']} iterations: {report['requests']} requests "
+          f"in {report['elapsed_seconds']}s ({report['requests_per_second']} req/s)")
+    if report.get('slow_clients'):
+        print(f"  {report['slow_clients']} slow clients, {report['slow_clients_open']} still connected at the end")
+    print(f"  {'step':<12}{'requests':>10}{'errors':>8}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}")
+    for name, step in report['steps'].items():
+        print(f"  {name:<12}{step['requests']:>10}{step['errors']:>8}"
+              f"{step['p50_ms']:>10.2f}{step['p95_ms']:>10.2f}{step['p99_ms']:>10.2f}")
+
+
+def compare(report, baseline, tolerance):
+    """Steps whose p95 regressed by more than ``tolerance`` (a fraction) against the baseline."""
+    regressions = []
+    for name, step in report['steps'].items():
+        before = baseline.get('steps', {}).get(name)
+        if not before or not before['p95_ms']:
+            continue
+        change = step['p95_ms'] / before['p95_ms'] - 1
+        print(f"  {name:<12} p95 {before['p95_ms']:>8.2f} -> {step['p95_ms']:>8.2f} ms ({change:+.0%})")
+        if change > tolerance:
+            regressions.append(name)
+    return regressions
+
+
+def in_process_app(in_memory):
+    """Import the app in this process, optionally on a seeded in-memory database."""
+    if in_memory:
+        try:
+            import mongomock
+        except ImportError:
+            sys.exit('--in-memory needs mongomock (pip install mongomock)')
+        import pymongo
+        import runpy
+
+        # One shared in-memory server for the seeder and the app
+        shared = mongomock.MongoClient()
+        pymongo.MongoClient = lambda *args, **kwargs: shared
+        with contextlib.redirect_stdout(sys.stderr):
+            runpy.run_path(os.path.join(ROOT_DIR, 'setup.py'), run_name='__main__')
+
+    import app
+    return app.app
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    target = parser.add_mutually_exclusive_group(required=True)
+    target.add_argument('--url', help='base URL of a running server')
+    target.add_argument('--in-process', action='store_true', help='import the app and use its test client')
+    target.add_argument('--in-memory', action='store_true', help='like --in-process, on a seeded mongomock database')
+    parser.add_argument('-c', '--concurrency', type=int, default=8, help='virtual users running at once')
+    parser.add_argument('-n', '--iterations', type=int, default=20, help='flow iterations per virtual user')
+    parser.add_argument('--seed', type=int, default=1, help='seed for the users and their choices')
+    parser.add_argument('--claim-ratio', type=float, default=0.7, help='share of scans that are claimed')
+    parser.add_argument('--slow-clients', type=int, default=0, metavar='N',
+                        help='with --url: hold N connections that never finish their request')
+    parser.add_argument('--save-baseline', metavar='FILE', help='write the report to FILE')
+    parser.add_argument('--baseline', metavar='FILE', help='compare p95 per step against FILE')
+    parser.add_argument('--tolerance', type=float, default=0.2, help='allowed p95 slowdown (default 0.2 = 20%%)')
+    parser.add_argument('--json', action='store_true', help='print the report as JSON')
+    args = parser.parse_args()
+    if args.slow_clients and not args.url:
+        parser.error('--slow-clients needs --url')
+
+    if args.url:
+        def make_session():
+            return HttpSession(args.url)
+    else:
+        flask_app = in_process_app(args.in_memory)
+
+        def make_session():
+            return TestClientSession(flask_app)
+
+    slow_clients = SlowClients(args.url, args.slow_clients) if args.slow_clients else None
+    report = run(make_session, args.concurrency, args.iterations, args.seed, args.claim_ratio, slow_clients)
+
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        print_report(report)
+
+    if args.save_baseline:
+        with open(args.save_baseline, 'w') as f:
+            json.dump(report, f, indent=2)
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        regressions = compare(report, baseline, args.tolerance)
+        if regressions:
+            print(f"p95 regressed by more than {args.tolerance:.0%} in: {', '.join(regressions)}")
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,229 @@
+"""In-process metrics, exported at /metrics in the Prometheus text format.
+
+Request latency histograms per route/method/status, counters for the case
+economy (scans, claims, openings, sales, RC in and out) and Mongo
+connection pool gauges.
+
+Recording is lock-free: every thread (or greenlet, under gevent) writes
+into its own shard, which only it ever modifies. A scrape sums the shards.
+When a thread or greenlet goes away its shard is folded into a retired
+total, so thread- and greenlet-per-request servers don't grow the shard
+list without bound.
+"""
+from bisect import bisect_left
+from collections import deque
+import threading
+import time
+import weakref
+
+from flask import g, request
+from pymongo import monitoring
+
+# Request latency buckets (seconds)
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+class _Owner:
+    """Lives in a thread's local storage; collected when the thread (or greenlet) ends."""
+    __slots__ = ('shard', '__weakref__')
+
+
+class Registry:
+    def __init__(self):
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._shards = {}  # id(shard) -> {key: value}
+        self._retired = {}
+        self._finished = deque()  # shards of ended threads, merged at the next scrape
+        self._metrics = {}  # name -> (type, help, buckets)
+        self._collectors = []
+
+    def counter(self, name, help):
+        self._metrics[name] = ('counter', help, None)
+
+    def gauge(self, name, help):
+        """An up/down counter: ``inc`` with negative amounts to decrease it."""
+        self._metrics[name] = ('gauge', help, None)
+
+    def histogram(self, name, help, buckets):
+        self._metrics[name] = ('histogram', help, tuple(buckets))
+
+    def collector(self, collect):
+        """``collect()`` yields (name, type, help, [(labels, value)]) at scrape time."""
+        self._collectors.append(collect)
+
+    def _shard(self):
+        owner = getattr(self._local, 'owner', None)
+        if owner is None:
+            owner = self._local.owner = _Owner()
+            owner.shard = {}
+            with self._lock:
+                self._shards[id(owner.shard)] = owner.shard
+            # Thread-locals are dropped when their thread ends. The finalizer may run
+            # anywhere (even inside a scrape), so it only queues the shard
+            weakref.finalize(owner, self._finished.append, owner.shard)
+        return owner.shard
+
+    def inc(self, name, amount=1, labels=()):
+        shard = self._shard()
+        key = (name, labels)
+        shard[key] = shard.get(key, 0) + amount
+
+    def observe(self, name, value, labels=()):
+        buckets = self._metrics[name][2]
+        shard = self._shard()
+        key = (name, labels)
+        values = shard.get(key)
+        if values is None:
+            # One slot per bucket plus +Inf, then the sum
+            values = shard[key] = [0] * (len(buckets) + 2)
+        values[bisect_left(buckets, value)] += 1
+        values[-1] += value
+
+    @staticmethod
+    def _merge(into, shard):
+        for key, value in shard.items():
+            if isinstance(value, list):
+                current = into.get(key)
+                into[key] = list(value) if current is None else [a + b for a, b in zip(current, value)]
+            else:
+                into[key] = into.get(key, 0) + value
+
+    def snapshot(self):
+        """{(name, labels): value} summed over every thread."""
+        with self._lock:
+            while self._finished:
+                shard = self._finished.popleft()
+                del self._shards[id(shard)]
+                self._merge(self._retired, shard)
+            live = list(self._shards.values())
+            totals = {}
+            self._merge(totals, self._retired)
+        for shard in live:
+            # dict.copy() is atomic under the GIL, the owning thread may keep writing
+            self._merge(totals, shard.copy())
+        return totals
+
+    def render(self):
+        """All metrics in the Prometheus text exposition format."""
+        values = {}
+        for (name, labels), value in self.snapshot().items():
+            values.setdefault(name, []).append((labels, value))
+
+        lines = []
+        for name, (kind, help, buckets) in self._metrics.items():
+            lines.append(f"# HELP {name} {help}")
+            lines.append(f"# TYPE {name} {kind}")
+            samples = values.get(name)
+            if not samples and kind != 'histogram':
+                # Unlabelled counters and gauges start at zero
+                samples = [((), 0)]
+            for labels, value in sorted(samples or []):
+                if kind != 'histogram':
+                    lines.append(f"{name}{_labels(labels)} {_number(value)}")
+                    continue
+                cumulative = 0
+                for bound, count in zip(buckets + (float('inf'),), value):
+                    cumulative += count
+                    le = '+Inf' if bound == float('inf') else _number(bound)
+                    lines.append(f"{name}_bucket{_labels(labels + (('le', le),))} {cumulative}")
+                lines.append(f"{name}_sum{_labels(labels)} {_number(value[-1])}")
+                lines.append(f"{name}_count{_labels(labels)} {cumulative}")
+
+        for collect in self._collectors:
+            for name, kind, help, samples in collect():
+                lines.append(f"# HELP {name} {help}")
+                lines.append(f"# TYPE {name} {kind}")
+                for labels, value in samples:
+                    lines.append(f"{name}{_labels(labels)} {_number(value)}")
+
+        return '\n'.join(lines) + '\n'
+
+
+def _escape(value):
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _labels(labels):
+    if not labels:
+        return ''
+    return '{' + ','.join(f'{key}="{_escape(value)}"' for key, value in labels) + '}'
+
+
+def _number(value):
+    if isinstance(value, float):
+        return repr(round(value, 6))
+    return str(value)
+
+
+registry = Registry()
+inc = registry.inc
+
+registry.histogram('http_request_duration_seconds', 'Request latency by route, method and status.', LATENCY_BUCKETS)
+registry.counter('cases_scanned_total', 'Cases scanned (X-ray).')
+registry.counter('cases_claimed_total', 'Scanned cases claimed into an inventory.')
+registry.counter('cases_opened_total', 'Cases opened in bulk.')
+registry.counter('items_sold_total', 'Inventory items sold.')
+registry.counter('rc_spent_total', 'RC debited from balances (scan fees and case openings).')
+registry.counter('rc_paid_out_total', 'RC credited to balances for sold items.')
+registry.counter('rc_deposited_total', 'RC added through add-funds.')
+registry.gauge('mongo_pool_connections', 'Open connections in the MongoDB pools.')
+registry.gauge('mongo_pool_checked_out', 'MongoDB connections currently checked out.')
+
+
+class PoolMetrics(monitoring.ConnectionPoolListener):
+    """Keeps the mongo_pool_* gauges; pass it in the MongoClient's event_listeners."""
+
+    def connection_created(self, event):
+        inc('mongo_pool_connections', 1)
+
+    def connection_closed(self, event):
+        inc('mongo_pool_connections', -1)
+
+    def connection_checked_out(self, event):
+        inc('mongo_pool_checked_out', 1)
+
+    def connection_checked_in(self, event):
+        inc('mongo_pool_checked_out', -1)
+
+    def pool_created(self, event):
+        pass
+
+    def pool_ready(self, event):
+        pass
+
+    def pool_cleared(self, event):
+        pass
+
+    def pool_closed(self, event):
+        pass
+
+    def connection_ready(self, event):
+        pass
+
+    def connection_check_out_started(self, event):
+        pass
+
+    def connection_check_out_failed(self, event):
+        pass
+
+
+pool_listener = PoolMetrics()
+
+
+def _start_timer():
+    g.metrics_started_at = time.perf_counter()
+
+
+def _record_request(response):
+    started_at = g.pop('metrics_started_at', None)
+    if started_at is not None:
+        route = request.url_rule.rule if request.url_rule else 'unmatched'
+        registry.observe('http_request_duration_seconds', time.perf_counter() - started_at,
+                         (('route', route), ('method', request.method), ('status', str(response.status_code))))
+    return response
+
+
+def init_app(app):
+    app.before_request(_start_timer)
+    app.after_request(_record_request)
@@ -0,0 +1,93 @@
+"""Move embedded users.inventory arrays into the inventory_items collection.
+
+Run once after deploying the inventory_items release (it is safe to run while
+the app is serving, and safe to rerun):
+
+    python api/migrate_inventory.py
+
+It first merges duplicate users (older logins could create two documents
+for one steam_id), which otherwise block the unique steam_id index.
+Users that log in before it reaches them are migrated lazily by /api/user.
+It also copies skin price and rarity onto items stored without them and
+marks every user's inventory totals for a recount on their next view.
+"""
+from pymongo import MongoClient
+from dotenv import load_dotenv
+import os
+
+import indexes
+import inventory
+import wallet
+
+# Load environment variables
+load_dotenv()
+
+mongo_uri = os.getenv('MONGO_URI', 'mongodb://localhost:27017/')
+mongo_db = os.getenv('MONGO_DB', 'csgo_cases_db')
+
+# Every user document was created with this balance (see auth in app.py)
+STARTING_BALANCE = 100.0
+
+
+def duplicate_users(db):
+    """{steam_id: [user _id, ...]} for every steam_id with more than one user, oldest first."""
+    duplicates = db.users.aggregate([
+        {"$sort": {"_id": 1}},
+        {"$group": {"_id": "$steam_id", "ids": {"$push": "$_id"}, "n": {"$sum": 1}}},
+        {"$match": {"n": {"$gt": 1}}},
+    ], allowDiskUse=True)
+    return {group['_id']: group['ids'] for group in duplicates}
+
+
+def merge_duplicate_users(db):
+    """Fold each steam_id's extra user documents into its oldest one; returns the steam_ids merged.
+
+    The kept user gets the extras' embedded inventories, pending sales and the
+    RC they hold beyond their starting grant; its totals are recounted lazily.
+    """
+    duplicates = duplicate_users(db)
+    for steam_id, (kept_id, *extra_ids) in duplicates.items():
+        balance = 0.0
+        embedded = []
+        settled = []
+        for extra in db.users.find({"_id": {"$in": extra_ids}}):
+            balance += max(extra.get('balance', 0) - STARTING_BALANCE, 0)
+            embedded += extra.get('inventory', [])
+            settled += extra.get(wallet.SETTLED_SALES, [])
+
+        db.users.update_one({"_id": kept_id}, {
+            "$inc": {"balance": balance},
+            "$push": {"inventory": {"$each": embedded}, wallet.SETTLED_SALES: {"$each": settled}},
+            "$set": {inventory.COUNTED_FIELD: False},
+        })
+        db.users.delete_many({"_id": {"$in": extra_ids}})
+    return list(duplicates)
+
+
+def migrate_all(db):
+    merged = merge_duplicate_users(db)
+    if merged:
+        print(f"Merged duplicate user documents for {len(merged)} steam ids: {', '.join(merged[:20])}")
+    indexes.ensure_indexes(db)
+
+    users_migrated = 0
+    items_migrated = 0
+
+    # Only users that still have something in the embedded array
+    for user in db.users.find({"inventory.0": {"$exists": True}}, {"steam_id": 1}):
+        moved = inventory.migrate_user(db, user['steam_id'])
+        if moved:
+            users_migrated += 1
+            items_migrated += moved
+
+    # Items stored before the sort keys were denormalized; counters are recounted lazily
+    inventory.backfill_skin_fields(db)
+    inventory.recount_all(db)
+
+    return users_migrated, items_migrated
+
+
+if __name__ == '__main__':
+    client = MongoClient(mongo_uri)
+    users_migrated, items_migrated = migrate_all(client[mongo_db])
+    print(f"Migrated {items_migrated} items for {users_migrated} users")
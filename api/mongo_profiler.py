@@ -0,0 +1,182 @@
+"""Per-request MongoDB command accounting.
+
+A pymongo command listener attributes every command to the Flask request
+(and endpoint) that issued it: how many commands ran and how long they took.
+Each response gets a Server-Timing header:
+
+    Server-Timing: mongo;dur=3.412;desc="5 commands", app;dur=7.950
+
+With MONGO_PROFILE_BYTES=1 the size of every reply is counted as well
+("5 commands, 2184 B"). That re-encodes each reply, so it is off by default.
+
+A warning is logged when one request runs the same query shape more than
+N_PLUS_ONE_THRESHOLD times (the classic N+1 loop). getMore batches continue
+a query already counted and are left out. Commands issued outside a request
+(startup, background threads) are ignored.
+"""
+from contextvars import ContextVar
+import logging
+import os
+import threading
+import time
+
+import bson
+from flask import request
+from pymongo import monitoring
+
+logger = logging.getLogger(__name__)
+
+ENABLED = os.getenv('MONGO_PROFILING', '1') != '0'
+COUNT_BYTES = os.getenv('MONGO_PROFILE_BYTES', '0') == '1'
+N_PLUS_ONE_THRESHOLD = int(os.getenv('N_PLUS_ONE_THRESHOLD', 5))
+
+# Keys of each command that hold the part of the query that defines its shape
+SHAPE_KEYS = {
+    'find': ('filter', 'sort', 'projection'),
+    'aggregate': ('pipeline',),
+    'count': ('query',),
+    'distinct': ('key', 'query'),
+    'findAndModify': ('query', 'sort'),
+    'update': ('updates',),
+    'delete': ('deletes',),
+}
+
+
+def query_shape(value):
+    """The structure of a query with every literal value replaced by '?'."""
+    if isinstance(value, dict):
+        return {key: query_shape(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        # One element is enough to show the shape ($in lists, pipelines differ per stage)
+        shapes = [query_shape(item) for item in value]
+        if shapes and all(shape == '?' for shape in shapes):
+            return ['?']
+        return shapes
+    return '?'
+
+
+def command_shape(command_name, command):
+    if command_name == 'getMore':
+        # The command's value is the cursor id; every batch of a collection has one shape
+        return f"getMore {command.get('collection')}"
+    collection = command.get(command_name)
+    parts = {key: query_shape(command[key]) for key in SHAPE_KEYS.get(command_name, ()) if key in command}
+    if command_name in ('update', 'delete'):
+        # Bulk writes repeat one statement shape many times
+        parts = {key: value[:1] for key, value in parts.items()}
+    return f"{command_name} {collection} {parts}"
+
+
+class RequestStats:
+    __slots__ = ('endpoint', 'started_at', 'commands', 'duration', 'bytes', 'shapes', 'pending')
+
+    def __init__(self, endpoint):
+        self.endpoint = endpoint
+        self.started_at = time.perf_counter()
+        self.commands = 0
+        self.duration = 0.0
+        self.bytes = 0
+        self.shapes = {}
+        self.pending = {}
+
+
+_current = ContextVar('mongo_request_stats', default=None)
+
+
+class EndpointTotals:
+    """Cumulative commands, seconds and bytes per endpoint since startup."""
+
+    def __init__(self):
+        self._totals = {}
+        self._lock = threading.Lock()
+
+    def add(self, stats):
+        with self._lock:
+            totals = self._totals.setdefault(stats.endpoint, [0, 0, 0.0, 0])
+            totals[0] += 1
+            totals[1] += stats.commands
+            totals[2] += stats.duration
+            totals[3] += stats.bytes
+
+    def snapshot(self):
+        """{endpoint: (requests, commands, seconds, bytes)}"""
+        with self._lock:
+            return {endpoint: tuple(totals) for endpoint, totals in self._totals.items()}
+
+
+totals = EndpointTotals()
+
+
+class CommandProfiler(monitoring.CommandListener):
+    def started(self, event):
+        stats = _current.get()
+        if stats is None:
+            return
+        shape = command_shape(event.command_name, event.command)
+        stats.pending[event.request_id] = shape
+        if event.command_name != 'getMore':
+            stats.shapes[shape] = stats.shapes.get(shape, 0) + 1
+
+    def _finished(self, event, reply_size):
+        stats = _current.get()
+        if stats is None or stats.pending.pop(event.request_id, None) is None:
+            return
+        stats.commands += 1
+        stats.duration += event.duration_micros / 1e6
+        stats.bytes += reply_size
+
+    def succeeded(self, event):
+        counted = COUNT_BYTES and _current.get() is not None
+        self._finished(event, len(bson.encode(event.reply)) if counted else 0)
+
+    def failed(self, event):
+        self._finished(event, 0)
+
+
+listener = CommandProfiler()
+
+
+def _start_request():
+    # Unmatched paths share one label, so made-up URLs can't grow the totals or /metrics
+    _current.set(RequestStats(request.endpoint or 'unmatched'))
+
+
+def _finish_request(response):
+    stats = _current.get()
+    if stats is None:
+        return response
+    _current.set(None)
+
+    elapsed = time.perf_counter() - stats.started_at
+    desc = f'{stats.commands} commands' + (f', {stats.bytes} B' if COUNT_BYTES else '')
+    response.headers.add(
+        'Server-Timing',
+        f'mongo;dur={stats.duration * 1000:.3f};desc="{desc}", app;dur={elapsed * 1000:.3f}'
+    )
+
+    for shape, count in stats.shapes.items():
+        if count > N_PLUS_ONE_THRESHOLD:
+            logger.warning("Possible N+1 in %s: %d x %s", stats.endpoint, count, shape)
+
+    totals.add(stats)
+    return response
+
+
+def init_app(app):
+    """Attribute commands to requests of ``app``. The MongoClient needs ``event_listeners=[listener]``."""
+    if ENABLED:
+        app.before_request(_start_request)
+        app.after_request(_finish_request)
+
+
+def metric_samples():
+    """Per-endpoint totals for the /metrics registry (see metrics.Registry.collector)."""
+    snapshot = totals.snapshot()
+    series = [
+        (1, 'mongo_commands_total', 'counter', 'MongoDB commands run, by endpoint.'),
+        (2, 'mongo_command_seconds_total', 'counter', 'Time spent in MongoDB commands, by endpoint.'),
+    ]
+    if COUNT_BYTES:
+        series.append((3, 'mongo_reply_bytes_total', 'counter', 'Bytes returned by MongoDB, by endpoint.'))
+    for index, name, kind, help in series:
+        yield name, kind, help, [((('endpoint', endpoint),), values[index]) for endpoint, values in sorted(snapshot.items())]
@@ -0,0 +1,54 @@
+"""Build every catalog-derived cache before the app serves traffic.
+
+gunicorn.conf.py runs ``warm_catalog`` in the master process before it forks
+the workers. The drop tables, price book, case stats and encoded catalog
+responses are then built once and shared copy-on-write, instead of every
+worker rebuilding them on its first requests. Workers keep them for as long
+as the catalog version stays the same.
+"""
+from flask import Flask
+from pymongo import MongoClient
+import gc
+
+import catalog
+import catalog_responses
+import drops
+import pricing
+import stats
+from json_provider import MongoJSONProvider
+
+
+def warm_catalog(db):
+    """Fill the per-version caches from ``db``; returns the number of cases."""
+    # Responses are encoded with the app's JSON provider, which needs an app context
+    encoder = Flask(__name__)
+    encoder.json = MongoJSONProvider(encoder)
+
+    case_ids = [case['_id'] for case in db.cases.find({}, {"_id": 1})]
+    with encoder.app_context():
+        catalog_responses.get_cases(db)
+        for case_id in case_ids:
+            catalog_responses.get_case(db, case_id)
+            drops.get_drop_table(db, case_id)
+    pricing.get_price_book(db)
+    stats.get_all_case_stats(db)
+    return len(case_ids)
+
+
+def preload(mongo_uri, mongo_db):
+    """Warm the caches through a client of its own, closed before returning.
+
+    pymongo clients must not be carried across a fork; workers open theirs
+    when they import the app.
+    """
+    client = MongoClient(mongo_uri)
+    try:
+        cases = warm_catalog(client[mongo_db])
+        version = catalog.current_version(client[mongo_db])
+    finally:
+        client.close()
+
+    # Keep the collector from touching (and so copying) the shared pages in every worker
+    gc.collect()
+    gc.freeze()
+    return version, cases
@@ -0,0 +1,133 @@
+"""Sell price engine shared by every endpoint that values inventory items.
+
+Sell price = 90% of the skin's market price, times a float quality bonus
+(1.0-1.3), times 2 for StatTrak™, times the special pattern multiplier.
+The per-skin constants are compiled once per catalog version into a
+``PriceBook``; pricing an item or a whole inventory then needs no queries.
+"""
+try:
+    import numpy as np
+except ImportError:  # Batches are priced item by item instead
+    np = None
+
+import catalog
+import catalog_store
+
+SELL_RATIO = 0.9  # Base sell price (90% of market value)
+FLOAT_BONUS = 0.3  # Best float adds 30%
+STATTRAK_MULTIPLIER = 2.0
+
+# Special patterns can be worth a lot more
+PATTERN_MULTIPLIERS = {
+    "Fade": 1.5,
+    "Marble Fade": 1.8,
+    "Tiger Tooth": 1.7,
+    "Doppler Ruby": 4.0,
+    "Doppler Sapphire": 5.0,
+    "Doppler Black Pearl": 3.5,
+    "Blue Gem": 3.0,
+    "Fire and Ice": 2.5
+}
+DEFAULT_PATTERN_MULTIPLIER = 1.5  # Unspecified special patterns
+
+
+def pattern_multiplier(pattern):
+    if not pattern:
+        return 1.0
+    return PATTERN_MULTIPLIERS.get(pattern, DEFAULT_PATTERN_MULTIPLIER)
+
+
+class PriceBook:
+    """Per-skin pricing constants: market price, base sell price, float range.
+
+    Built from the catalog store's columns; the market prices and the skin
+    index are the store's own, not copies.
+    """
+
+    __slots__ = ('index', 'price', 'base', 'min_float', 'inv_range', 'has_range')
+
+    def __init__(self, store):
+        self.index = store.skin_index
+        price = store.column('price')
+        min_float = store.column('min_float')
+        max_float = store.column('max_float')
+
+        if np is not None:
+            # NaN (no float range) compares False, so those rows get no float bonus
+            with np.errstate(invalid='ignore'):
+                span = max_float - min_float
+                self.has_range = span > 0
+            self.price = price
+            self.base = price * SELL_RATIO
+            self.min_float = np.where(self.has_range, min_float, 0.0)
+            self.inv_range = np.divide(1.0, span, out=np.zeros_like(span), where=self.has_range)
+        else:
+            self.price = price
+            self.base = [value * SELL_RATIO for value in price]
+            self.has_range = [max_value - min_value > 0 for min_value, max_value in zip(min_float, max_float)]
+            self.min_float = [min_value if has_range else 0.0
+                              for min_value, has_range in zip(min_float, self.has_range)]
+            self.inv_range = [1 / (max_value - min_value) if has_range else 0.0
+                              for min_value, max_value, has_range in zip(min_float, max_float, self.has_range)]
+
+    def __contains__(self, skin_id):
+        return skin_id in self.index
+
+    def sell_price(self, item):
+        """Sell price of one inventory item (rounded to 2 decimals)."""
+        i = self.index[item['skin_id']]
+
+        price_multiplier = 1.0
+
+        # Float value adjustment (0 = worst, 1 = best)
+        if self.has_range[i]:
+            float_quality = 1 - ((item['float'] - self.min_float[i]) * self.inv_range[i])
+            price_multiplier *= 1 + (float_quality * FLOAT_BONUS)
+
+        # StatTrak™ adjustment
+        if item.get('is_stattrak', False):
+            price_multiplier *= STATTRAK_MULTIPLIER
+
+        price_multiplier *= pattern_multiplier(item.get('special_pattern'))
+
+        return round(float(self.base[i] * price_multiplier), 2)
+
+    def sell_prices(self, items):
+        """Sell prices for a list of inventory items, vectorized when NumPy is available.
+
+        Every item's skin must be in the book.
+        """
+        if np is None or not items:
+            return [self.sell_price(item) for item in items]
+
+        index = np.fromiter((self.index[item['skin_id']] for item in items), dtype=np.int64, count=len(items))
+        floats = np.fromiter((item['float'] for item in items), dtype=np.float64, count=len(items))
+        stattrak = np.fromiter((item.get('is_stattrak', False) for item in items), dtype=bool, count=len(items))
+        patterns = np.fromiter((pattern_multiplier(item.get('special_pattern')) for item in items),
+                               dtype=np.float64, count=len(items))
+
+        float_quality = 1 - ((floats - self.min_float[index]) * self.inv_range[index])
+        price_multiplier = np.where(self.has_range[index], 1 + (float_quality * FLOAT_BONUS), 1.0)
+        price_multiplier = price_multiplier * np.where(stattrak, STATTRAK_MULTIPLIER, 1.0)
+        price_multiplier = price_multiplier * patterns
+
+        # Round in Python so results match sell_price exactly
+        return [round(price, 2) for price in (self.base[index] * price_multiplier).tolist()]
+
+    def market_value(self, items):
+        """Total market price of a list of inventory items."""
+        if np is None or not items:
+            return sum(self.price[self.index[item['skin_id']]] for item in items)
+        index = np.fromiter((self.index[item['skin_id']] for item in items), dtype=np.int64, count=len(items))
+        return float(self.price[index].sum())
+
+
+_books = catalog.VersionedCache()
+
+
+def get_price_book(db):
+    """The price book for the current catalog version."""
+    def build():
+        return PriceBook(catalog_store.get_store(db))
+
+    return _books.get(db, 'skins', build)
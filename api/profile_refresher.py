@@ -0,0 +1,192 @@
+"""Background refresh of users' Steam names and avatars.
+
+Login doesn't call Steam: new users start with a placeholder profile and
+existing users keep what is stored. This job keeps ``users.username`` and
+``users.avatar`` fresh instead, asking GetPlayerSummaries for up to 100
+users per call (several calls in flight, up to ``concurrency``) and writing
+each round back with one ``bulk_write``.
+
+Every gunicorn worker runs a refresher, so users are leased before they are
+refreshed: claiming moves ``profile_refreshed_at`` forward just far enough
+that the user stays off everyone's stale list for CLAIM_TTL. A claimed user
+is refreshed by one worker only. If that worker dies, or Steam fails, the
+lease runs out and the user is stale again.
+
+The app runs it in a background thread (PROFILE_REFRESH_INTERVAL seconds
+between passes, 0 to disable); it can also run on its own, e.g. from cron:
+
+    python api/profile_refresher.py --once
+"""
+from concurrent.futures import ThreadPoolExecutor
+from bson.objectid import ObjectId
+from datetime import datetime, timedelta
+from pymongo import MongoClient, UpdateOne
+from dotenv import load_dotenv
+import argparse
+import logging
+import os
+import threading
+
+import requests
+
+import steam
+
+logger = logging.getLogger(__name__)
+
+# Load environment variables
+load_dotenv()
+
+mongo_uri = os.getenv('MONGO_URI', 'mongodb://localhost:27017/')
+mongo_db = os.getenv('MONGO_DB', 'csgo_cases_db')
+
+REFRESH_INTERVAL = float(os.getenv('PROFILE_REFRESH_INTERVAL', 600))
+STALE_AFTER = timedelta(seconds=float(os.getenv('PROFILE_STALE_AFTER', 24 * 3600)))
+CONCURRENCY = int(os.getenv('PROFILE_REFRESH_CONCURRENCY', 4))
+CLAIM_TTL = timedelta(minutes=5)
+
+DEFAULT_AVATAR = 'https://steamcdn-a.akamaihd.net/steamcommunity/public/images/avatars/fe/fef49e7fa7e1997310d705b2a6158ff8dc1cdfeb.jpg'
+
+
+def placeholder_profile(steam_id):
+    """Name and avatar a user has until the first refresh."""
+    return {"username": f'User_{steam_id[-5:]}', "avatar": DEFAULT_AVATAR}
+
+
+def stale_steam_ids(db, limit, now=None):
+    """Users never refreshed, then the longest-unrefreshed ones."""
+    cutoff = (now or datetime.now()) - STALE_AFTER
+    never = [user['steam_id'] for user in db.users.find(
+        {"profile_refreshed_at": None}, {"steam_id": 1}
+    ).limit(limit)]
+    if len(never) >= limit:
+        return never
+    stale = [user['steam_id'] for user in db.users.find(
+        {"profile_refreshed_at": {"$lt": cutoff}}, {"steam_id": 1}
+    ).sort("profile_refreshed_at", 1).limit(limit - len(never))]
+    return never + stale
+
+
+def claim_stale(db, limit, now=None):
+    """Lease up to ``limit`` stale users to this process; returns their steam ids.
+
+    The candidates are claimed with one ``update_many`` that re-checks that
+    each is still stale, so of two workers racing for a user only one gets it.
+    """
+    now = now or datetime.now()
+    candidates = stale_steam_ids(db, limit, now)
+    if not candidates:
+        return []
+
+    claim = ObjectId()
+    db.users.update_many(
+        {"steam_id": {"$in": candidates},
+         "$or": [{"profile_refreshed_at": None}, {"profile_refreshed_at": {"$lt": now - STALE_AFTER}}]},
+        {"$set": {"profile_refreshed_at": now - STALE_AFTER + CLAIM_TTL, "profile_refresh_claim": claim}}
+    )
+    return [user['steam_id'] for user in db.users.find(
+        {"steam_id": {"$in": candidates}, "profile_refresh_claim": claim}, {"steam_id": 1}
+    )]
+
+
+def refresh(db, client, steam_ids, concurrency=CONCURRENCY):
+    """Refresh the given users; returns how many were written back.
+
+    Ids in a batch Steam answered are marked refreshed even if Steam didn't
+    return them (deleted accounts), so they don't hold up the queue; ids in
+    a failed batch are retried once their claim runs out.
+    """
+    batches = [steam_ids[i:i + steam.MAX_IDS_PER_CALL] for i in range(0, len(steam_ids), steam.MAX_IDS_PER_CALL)]
+    if not batches:
+        return 0
+
+    def fetch(batch):
+        try:
+            return batch, client.fetch_player_summaries(batch)
+        except (requests.RequestException, ValueError, KeyError) as e:
+            logger.warning("Profile refresh batch of %d failed: %s", len(batch), type(e).__name__)
+            return batch, None
+
+    now = datetime.now()
+    operations = []
+    with ThreadPoolExecutor(max_workers=max(1, min(concurrency, len(batches)))) as pool:
+        for batch, players in pool.map(fetch, batches):
+            if players is None:
+                continue
+            for steam_id in batch:
+                update = {"profile_refreshed_at": now}
+                player = players.get(steam_id)
+                if player:
+                    update["username"] = player['personaname']
+                    update["avatar"] = player['avatar']
+                operations.append(UpdateOne({"steam_id": steam_id}, {"$set": update}))
+
+    if operations:
+        db.users.bulk_write(operations, ordered=False)
+    return len(operations)
+
+
+def refresh_stale(db, client, concurrency=CONCURRENCY):
+    """One full pass over stale users, ``concurrency`` batches per round."""
+    total = 0
+    round_size = steam.MAX_IDS_PER_CALL * concurrency
+    while True:
+        steam_ids = claim_stale(db, round_size)
+        written = refresh(db, client, steam_ids, concurrency)
+        total += written
+        # A short or failed round means we're done (or Steam is down, or other workers
+        # have the rest) until the next pass
+        if len(steam_ids) < round_size or written < len(steam_ids):
+            return total
+
+
+class ProfileRefresher:
+    """Daemon thread that runs ``refresh_stale`` every ``interval`` seconds.
+
+    ``wake()`` cuts the wait short, so a brand new user's placeholder profile
+    is replaced within moments of their first login.
+    """
+
+    def __init__(self, db, client, interval=REFRESH_INTERVAL, concurrency=CONCURRENCY):
+        self.db = db
+        self.client = client
+        self.interval = interval
+        self.concurrency = concurrency
+        self._wake = threading.Event()
+        self._thread = None
+
+    def start(self):
+        if self._thread is None and self.interval > 0 and self.client.api_key:
+            self._thread = threading.Thread(target=self.run, name='profile-refresher', daemon=True)
+            self._thread.start()
+        return self
+
+    def wake(self):
+        self._wake.set()
+
+    def run(self):
+        """Refresh loop; runs until the process exits."""
+        while True:
+            self._wake.clear()
+            try:
+                refresh_stale(self.db, self.client, self.concurrency)
+            except Exception:
+                logger.exception("Profile refresh pass failed")
+            self._wake.wait(self.interval)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--once', action='store_true', help='run a single pass and exit')
+    parser.add_argument('-c', '--concurrency', type=int, default=CONCURRENCY, help='GetPlayerSummaries calls in flight')
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    db = MongoClient(mongo_uri)[mongo_db]
+    client = steam.SteamClient(os.getenv('STEAM_API_KEY', ''))
+    if not client.api_key:
+        parser.error('STEAM_API_KEY is not set')
+
+    if args.once:
+        print(f"Refreshed {refresh_stale(db, client, args.concurrency)} profiles")
+    else:
+        ProfileRefresher(db, client, concurrency=args.concurrency).run()
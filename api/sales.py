@@ -0,0 +1,94 @@
+"""Selling inventory items for RC.
+
+A sale removes items from inventory_items and credits the balance. Those are
+writes to two documents with no transaction around them, so a sale is done
+in steps that can be picked up again if the process dies between them:
+
+1. reserve: the items get the sale's ``sale_id`` and a lease
+   (``reserved_until``). Reserved items are hidden from listings, and no
+   other sale can reserve them.
+2. credit: the balance and inventory totals move, and the sale id is recorded
+   in the user's ``settled_sales``, all in one write (see wallet.credit).
+3. delete the reserved items, then drop the sale id from ``settled_sales``.
+
+``recover`` cleans up a user's sales whose lease has passed. If the sale was
+credited, its items are deleted. If not, they are released back into the
+inventory. It runs before each of the user's sales and inventory listings.
+The lease is far longer than a request can run (gunicorn kills a worker
+after 30 s), so a sale is never recovered while it is still in progress.
+"""
+from datetime import datetime, timedelta
+
+from bson.objectid import ObjectId
+
+import inventory
+import wallet
+
+RESERVATION_TTL = timedelta(minutes=5)
+
+
+def _reserve(db, steam_id, sale_id, item_ids):
+    """Reserve whichever of ``item_ids`` are free; returns the reserved ids."""
+    reserved = db.inventory_items.update_many(
+        {"_id": {"$in": item_ids}, "steam_id": steam_id, "sale_id": {"$exists": False}},
+        {"$set": {"sale_id": sale_id, "reserved_until": datetime.now() + RESERVATION_TTL}}
+    )
+    if reserved.modified_count == len(item_ids):
+        return set(item_ids)
+    # Lost a race for some items: only sell what we reserved
+    return {item['_id'] for item in db.inventory_items.find({"sale_id": sale_id}, {"_id": 1})}
+
+
+def _release(db, sale_id):
+    db.inventory_items.update_many({"sale_id": sale_id}, {"$unset": {"sale_id": "", "reserved_until": ""}})
+
+
+def _finish(db, steam_id, sale_id):
+    db.inventory_items.delete_many({"sale_id": sale_id})
+    db.users.update_one({"steam_id": steam_id}, {"$pull": {wallet.SETTLED_SALES: sale_id}})
+
+
+def recover(db, steam_id):
+    """Finish or release the user's sales that outlived their lease; returns how many."""
+    expired = db.inventory_items.distinct("sale_id", {
+        "steam_id": steam_id, "sale_id": {"$exists": True}, "reserved_until": {"$lt": datetime.now()}
+    })
+    if not expired:
+        return 0
+
+    user = db.users.find_one({"steam_id": steam_id}, {wallet.SETTLED_SALES: 1})
+    settled = set(user.get(wallet.SETTLED_SALES, ())) if user else set()
+    for sale_id in expired:
+        if sale_id in settled:
+            _finish(db, steam_id, sale_id)
+        else:
+            _release(db, sale_id)
+    return len(expired)
+
+
+def sell(db, steam_id, items, price_book):
+    """Sell the user's ``items`` (distinct inventory documents) at their sell prices.
+
+    Items another sale has reserved are skipped. Returns ({item _id: price}
+    for the items sold, new balance). Raises wallet.UserNotFound, and then
+    nothing is sold.
+    """
+    recover(db, steam_id)
+
+    sale_id = ObjectId()
+    reserved = _reserve(db, steam_id, sale_id, [item['_id'] for item in items]) if items else set()
+    items = [item for item in items if item['_id'] in reserved]
+    prices = dict(zip((item['_id'] for item in items), price_book.sell_prices(items)))
+
+    # Pay first: if this fails the items go back, if we die after it recover() deletes them
+    try:
+        balance = wallet.credit(db, steam_id, sum(prices.values()),
+                                inventory.totals_delta(price_book, items, -1),
+                                sale_id if items else None)
+    except Exception:
+        _release(db, sale_id)
+        raise
+
+    if items:
+        _finish(db, steam_id, sale_id)
+    return prices, balance
@@ -0,0 +1,91 @@
+"""Pending X-ray scans ("scan tickets"), kept server-side.
+
+A scan stores the item the user gets if they claim it under an opaque
+random ticket id; the client only ever holds the id. Users can have several
+pending scans, for any cases.
+
+Tickets live in the ``scan_tickets`` collection, where a TTL index drops
+them SCAN_TICKET_TTL seconds after the scan. An in-process LRU sits in
+front, so a claim served by the worker that ran the scan needs no read.
+Claiming consumes the ticket with one ``find_one_and_delete``: of two
+racing claims (on any workers) only one gets it.
+"""
+from datetime import datetime, timedelta, timezone
+import os
+import secrets
+
+from ttl_cache import TTLCache
+
+TICKET_TTL = int(os.getenv('SCAN_TICKET_TTL', 3600))
+CACHE_SIZE = 10000
+
+_cache = TTLCache(TICKET_TTL, CACHE_SIZE)
+
+
+def _now():
+    return datetime.now(timezone.utc)
+
+
+def issue(db, steam_id, case_id, skin_id, item_float, is_stattrak):
+    """Store a scan result; returns its ticket id."""
+    ticket = {
+        "_id": secrets.token_urlsafe(16),
+        "steam_id": steam_id,
+        "case_id": str(case_id),
+        "skin_id": str(skin_id),
+        "float": item_float,
+        "is_stattrak": is_stattrak,
+        "expires_at": _now() + timedelta(seconds=TICKET_TTL)
+    }
+    db.scan_tickets.insert_one(ticket)
+    _cache.set(ticket['_id'], ticket)
+    return ticket['_id']
+
+
+def get(db, steam_id, ticket_id):
+    """The user's pending ticket with this id, or None."""
+    ticket = _cache.get(ticket_id)
+    if ticket is None:
+        ticket = db.scan_tickets.find_one({"_id": ticket_id, "expires_at": {"$gt": _now()}})
+    if ticket is None or ticket['steam_id'] != steam_id:
+        return None
+    return ticket
+
+
+def latest(db, steam_id, case_id):
+    """The user's most recent pending ticket for a case, or None (for clients that don't send ids)."""
+    return db.scan_tickets.find_one(
+        {"steam_id": steam_id, "case_id": str(case_id), "expires_at": {"$gt": _now()}},
+        sort=[("expires_at", -1)]
+    )
+
+
+def consume(db, steam_id, ticket_id):
+    """Remove a pending ticket and return it; None if it was already claimed, discarded or expired."""
+    _cache.pop(ticket_id)
+    return db.scan_tickets.find_one_and_delete(
+        {"_id": ticket_id, "steam_id": steam_id, "expires_at": {"$gt": _now()}}
+    )
+
+
+def restore(db, ticket):
+    """Put back a consumed ticket whose claim didn't go through."""
+    db.scan_tickets.insert_one(ticket)
+    _cache.set(ticket['_id'], ticket)
+
+
+def discard(db, steam_id, ticket_id=None, case_id=None):
+    """Drop one ticket or every ticket of a case; returns how many.
+
+    One of ``ticket_id`` and ``case_id`` is required.
+    """
+    query = {"steam_id": steam_id}
+    if ticket_id:
+        query["_id"] = ticket_id
+        _cache.pop(ticket_id)
+    elif case_id:
+        query["case_id"] = str(case_id)
+    else:
+        raise ValueError("A ticket or a case is required")
+    # Tickets still cached on other workers fail to consume once deleted here
+    return db.scan_tickets.delete_many(query).deleted_count
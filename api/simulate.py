@@ -0,0 +1,178 @@
+"""Monte Carlo case simulator and drop engine benchmark.
+
+Opens cases with the same compiled drop tables ``scan_case`` uses and
+compares what users really get against the odds /api/case-stats advertises:
+
+    python api/simulate.py                       # 1M openings of every case
+    python api/simulate.py -n 5000000 -w 8 --case "Chroma Case"
+    python api/simulate.py --vectorized --json   # benchmark open_many, JSON output
+"""
+from concurrent.futures import ProcessPoolExecutor
+from pymongo import MongoClient
+from dotenv import load_dotenv
+import argparse
+import json
+import os
+import random
+import time
+
+import drops
+import stats
+
+# Load environment variables
+load_dotenv()
+
+mongo_uri = os.getenv('MONGO_URI', 'mongodb://localhost:27017/')
+mongo_db = os.getenv('MONGO_DB', 'csgo_cases_db')
+
+CHUNK_SIZE = 100000
+
+# Drop tables shipped to each worker process once, by case id
+_worker_tables = {}
+
+
+def _init_worker(tables):
+    _worker_tables.update(tables)
+
+
+def _run_chunk(case_id, count, seed, vectorized):
+    """Open ``count`` cases and tally rarities, StatTrak™ and total value."""
+    table = _worker_tables[case_id]
+    rarities = {}
+    stattrak = 0
+    total_value = 0.0
+
+    if vectorized:
+        rng = drops.np.random.default_rng(seed)
+        results = table.open_many(count, rng)
+    else:
+        rng = random.Random(seed)
+        results = (table.open(rng) for _ in range(count))
+
+    for ref, item_float, is_stattrak in results:
+        rarity = ref.doc['quality']['title']
+        rarities[rarity] = rarities.get(rarity, 0) + 1
+        stattrak += is_stattrak
+        total_value += ref.doc['price']
+
+    return case_id, count, rarities, stattrak, total_value
+
+
+def load_tables(db, case_filter=None):
+    """Compile drop tables for every case (or the ones matching titles/ids)."""
+    tables = {}
+    for case in db.cases.find({}, {"_id": 1, "title": 1}):
+        if case_filter and case['title'] not in case_filter and str(case['_id']) not in case_filter:
+            continue
+        table = drops.get_drop_table(db, case['_id'])
+        if table and not table.is_empty:
+            tables[str(case['_id'])] = table
+    return tables
+
+
+def simulate(tables, openings, workers=None, seed=None, vectorized=False):
+    """Run ``openings`` per case across a process pool; returns per-case tallies and timing."""
+    seed_sequence = random.Random(seed)
+    jobs = []
+    for case_id in tables:
+        remaining = openings
+        while remaining > 0:
+            count = min(CHUNK_SIZE, remaining)
+            jobs.append((case_id, count, seed_sequence.getrandbits(64), vectorized))
+            remaining -= count
+
+    totals = {case_id: {"openings": 0, "rarities": {}, "stattrak": 0, "total_value": 0.0} for case_id in tables}
+
+    started = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(tables,)) as pool:
+        for case_id, count, rarities, stattrak, total_value in pool.map(_run_chunk, *zip(*jobs)):
+            case_totals = totals[case_id]
+            case_totals["openings"] += count
+            case_totals["stattrak"] += stattrak
+            case_totals["total_value"] += total_value
+            for rarity, hits in rarities.items():
+                case_totals["rarities"][rarity] = case_totals["rarities"].get(rarity, 0) + hits
+    elapsed = time.perf_counter() - started
+
+    return totals, elapsed
+
+
+def build_report(tables, totals):
+    """Empirical rates, EV and ROI next to the advertised case stats."""
+    report = []
+    for case_id, table in tables.items():
+        case_totals = totals[case_id]
+        openings = case_totals["openings"]
+        advertised = stats.compute_case_stats(table.case, [ref.doc for ref in table.skins_by_id.values()])
+        advertised_odds = {row["rarity"]: row["odds"] for row in advertised["rarity_stats"]}
+
+        expected_value = case_totals["total_value"] / openings
+        rarities = sorted(set(advertised_odds) | set(case_totals["rarities"]),
+                          key=lambda r: list(stats.RARITY_WEIGHTS).index(r) if r in stats.RARITY_WEIGHTS else 99)
+
+        report.append({
+            "case_id": case_id,
+            "title": table.case.get('title'),
+            "openings": openings,
+            "case_price": table.price,
+            "expected_value": round(expected_value, 2),
+            "advertised_expected_value": advertised["expected_value"],
+            "roi_percentage": round((expected_value / table.price - 1) * 100, 2),
+            "advertised_roi_percentage": advertised["roi_percentage"],
+            "stattrak_rate": round(case_totals["stattrak"] / openings * 100, 4),
+            "rarities": [{
+                "rarity": rarity,
+                "rate": round(case_totals["rarities"].get(rarity, 0) / openings * 100, 4),
+                "advertised_odds": advertised_odds.get(rarity, 0),
+            } for rarity in rarities],
+        })
+    return report
+
+
+def print_report(report, elapsed, openings_total):
+    for case in report:
+        print(f"\n{case['title']} ({case['openings']:,} openings, price {case['case_price']} RC)")
+        print(f"  EV   {case['expected_value']:>10.2f}  advertised {case['advertised_expected_value']:>10.2f}")
+        print(f"  ROI  {case['roi_percentage']:>9.2f}%  advertised {case['advertised_roi_percentage']:>9.2f}%")
+        print(f"  StatTrak™ {case['stattrak_rate']:.4f}%")
+        print(f"  {'rarity':<20}{'actual %':>12}{'advertised %':>15}")
+        for row in case['rarities']:
+            print(f"  {row['rarity']:<20}{row['rate']:>12.4f}{row['advertised_odds']:>15.4f}")
+
+    print(f"\n{openings_total:,} openings in {elapsed:.2f}s ({openings_total / elapsed:,.0f} openings/s)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('-n', '--openings', type=int, default=1000000, help='openings per case')
+    parser.add_argument('-w', '--workers', type=int, default=None, help='worker processes (default: CPU count)')
+    parser.add_argument('--case', action='append', help='case title or id (repeatable; default: all cases)')
+    parser.add_argument('--seed', type=int, default=None, help='seed for reproducible runs')
+    parser.add_argument('--vectorized', action='store_true', help='use the bulk open_many sampler')
+    parser.add_argument('--json', action='store_true', help='print the report as JSON')
+    args = parser.parse_args()
+
+    if args.vectorized and drops.np is None:
+        parser.error('--vectorized needs NumPy')
+
+    db = MongoClient(mongo_uri)[mongo_db]
+    tables = load_tables(db, args.case)
+    if not tables:
+        parser.error('no matching cases with skins')
+
+    totals, elapsed = simulate(tables, args.openings, args.workers, args.seed, args.vectorized)
+    report = build_report(tables, totals)
+    openings_total = args.openings * len(tables)
+
+    if args.json:
+        print(json.dumps({
+            "elapsed_seconds": round(elapsed, 3),
+            "openings_per_second": round(openings_total / elapsed),
+            "cases": report
+        }, indent=2))
+    else:
+        print_report(report, elapsed, openings_total)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,99 @@
+"""Case statistics (odds, average values, expected value and ROI).
+
+Stats only change when the catalog is reseeded, so they are computed once
+per catalog version and served from memory afterwards.
+"""
+import catalog
+import catalog_store
+
+# Advertised rarity weights used for the displayed odds
+RARITY_WEIGHTS = {
+    "Consumer Grade": 7980,
+    "Industrial Grade": 1598,
+    "Mil-Spec": 319.6,
+    "Restricted": 63.98,
+    "Classified": 12.8,
+    "Covert": 2.56,
+    "Exceedingly Rare": 3.2
+}
+
+
+def compute_case_stats(case, skins):
+    """Stats for one case, or None if the case has no skins."""
+    # Group skins by rarity
+    skins_by_rarity = {}
+    for skin in skins:
+        skins_by_rarity.setdefault(skin['quality']['title'], []).append(skin)
+
+    if not skins_by_rarity:
+        return None
+
+    # Calculate total weight for available rarities
+    total_weight = sum(weight for rarity, weight in RARITY_WEIGHTS.items() if rarity in skins_by_rarity)
+
+    # Calculate odds and expected values
+    expected_value = 0
+    rarity_stats = []
+
+    for rarity, weight in RARITY_WEIGHTS.items():
+        if rarity not in skins_by_rarity:
+            continue
+
+        odds = weight / total_weight
+
+        # Calculate average value for this rarity
+        rarity_skins = skins_by_rarity[rarity]
+        avg_value = sum(skin['price'] for skin in rarity_skins) / len(rarity_skins)
+
+        # Contribute to expected value
+        expected_value += odds * avg_value
+
+        rarity_stats.append({
+            "rarity": rarity,
+            "odds": round(odds * 100, 4),  # Convert to percentage
+            "count": len(rarity_skins),
+            "avg_value": round(avg_value, 2)
+        })
+
+    # Calculate ROI
+    roi = (expected_value / case['price']) - 1
+
+    return {
+        "case": case,
+        "expected_value": round(expected_value, 2),
+        "case_price": case['price'],
+        "roi_percentage": round(roi * 100, 2),
+        "rarity_stats": rarity_stats
+    }
+
+
+# case_id -> {"case": case document, "stats": stats or None}
+_entries = catalog.VersionedCache()
+
+
+def get_case_stats(db, case_oid):
+    """Cached entry for one case, or None if the case doesn't exist."""
+    def build():
+        store = catalog_store.get_store(db)
+        case = store.case(case_oid)
+        if not case:
+            return None
+        return {"case": case, "stats": compute_case_stats(case, store.skins_of_case(case_oid))}
+
+    return _entries.get(db, str(case_oid), build)
+
+
+def get_all_case_stats(db):
+    """Stats for every case (cases without skins are left out)."""
+    def build():
+        store = catalog_store.get_store(db)
+        all_stats = []
+        for case in store.cases:
+            entry = {"case": case, "stats": compute_case_stats(case, store.skins_of_case(case['_id']))}
+            # Seed the per-case cache while we're at it
+            _entries.get(db, str(case['_id']), lambda: entry)
+            if entry['stats']:
+                all_stats.append(entry['stats'])
+        return all_stats
+
+    return _entries.get(db, '*', build)
@@ -0,0 +1,57 @@
+"""Steam Web API client.
+
+One pooled keep-alive session per process, strict connect/read timeouts and
+a small retry budget for transient errors, so a slow or flapping Steam API
+can't tie up the profile refresher (profile_refresher.py, its only caller).
+
+Point STEAM_API_URL at a local server (see fake_steam.py) to test without
+hitting Steam.
+"""
+import os
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+STEAM_API_URL = os.getenv('STEAM_API_URL', 'https://api.steampowered.com')
+CONNECT_TIMEOUT = float(os.getenv('STEAM_CONNECT_TIMEOUT', 2))
+READ_TIMEOUT = float(os.getenv('STEAM_READ_TIMEOUT', 3))
+POOL_SIZE = int(os.getenv('STEAM_POOL_SIZE', 10))
+RETRIES = 2
+
+# GetPlayerSummaries accepts at most this many steamids per call
+MAX_IDS_PER_CALL = 100
+
+
+class SteamClient:
+    def __init__(self, api_key, base_url=STEAM_API_URL, timeout=(CONNECT_TIMEOUT, READ_TIMEOUT),
+                 pool_size=POOL_SIZE, retries=RETRIES):
+        self.api_key = api_key
+        self.base_url = base_url.rstrip('/')
+        self.timeout = timeout
+
+        retry = Retry(
+            total=retries,
+            backoff_factor=0.2,
+            status_forcelist=(429, 500, 502, 503, 504),
+            allowed_methods=('GET',),
+            raise_on_status=False
+        )
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry)
+        self.session = requests.Session()
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+
+    def fetch_player_summaries(self, steam_ids):
+        """One GetPlayerSummaries call for up to 100 ids.
+
+        Returns {steam_id: summary}; raises on timeouts and HTTP errors.
+        """
+        response = self.session.get(
+            f'{self.base_url}/ISteamUser/GetPlayerSummaries/v0002/',
+            params={'key': self.api_key, 'steamids': ','.join(steam_ids)},
+            timeout=self.timeout
+        )
+        response.raise_for_status()
+
+        return {player['steamid']: player for player in response.json()['response']['players']}
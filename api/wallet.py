@@ -0,0 +1,71 @@
+"""User balances (RC).
+
+Every debit and credit is one conditional ``find_one_and_update`` on the
+user document that also returns the new balance: no read/check/write in
+Python, so two concurrent requests can't both spend the same RC and a
+balance never goes negative. Other counters on the user (the inventory
+totals) can ride along in the same write through ``inc``, and a credit can
+record the sale that paid it (see sales.py).
+"""
+from pymongo import ReturnDocument
+
+
+class WalletError(Exception):
+    pass
+
+
+class UserNotFound(WalletError):
+    pass
+
+
+class InsufficientBalance(WalletError):
+    pass
+
+
+# Sales credited but whose items are not deleted yet
+SETTLED_SALES = 'settled_sales'
+
+
+def _apply(db, steam_id, delta, condition=None, inc=None, extra=None):
+    query = {"steam_id": steam_id}
+    if condition:
+        query.update(condition)
+    user = db.users.find_one_and_update(
+        query,
+        dict(extra or {}, **{"$inc": dict(inc or {}, balance=delta)}),
+        projection={"_id": 0, "balance": 1},
+        return_document=ReturnDocument.AFTER
+    )
+    return None if user is None else user['balance']
+
+
+def debit(db, steam_id, amount, inc=None):
+    """Take ``amount`` from the balance if it covers it; returns the new balance.
+
+    ``inc`` is applied to other fields only if the debit goes through.
+    Raises InsufficientBalance (nothing is taken) or UserNotFound.
+    """
+    if amount < 0:
+        raise ValueError("Debit amount must not be negative")
+    balance = _apply(db, steam_id, -amount, {"balance": {"$gte": amount}}, inc)
+    if balance is None:
+        # Only failed debits pay for the second lookup
+        if db.users.find_one({"steam_id": steam_id}, {"_id": 1}) is None:
+            raise UserNotFound(steam_id)
+        raise InsufficientBalance(amount)
+    return balance
+
+
+def credit(db, steam_id, amount, inc=None, sale_id=None):
+    """Add ``amount`` to the balance (and ``inc`` to other fields); returns the new balance.
+
+    ``sale_id``, if given, is added to the user's SETTLED_SALES in the same write.
+    Raises UserNotFound.
+    """
+    if amount < 0:
+        raise ValueError("Credit amount must not be negative")
+    extra = {"$push": {SETTLED_SALES: sale_id}} if sale_id is not None else None
+    balance = _apply(db, steam_id, amount, inc=inc, extra=extra)
+    if balance is None:
+        raise UserNotFound(steam_id)
+    return balance
@@ -5,6 +5,7 @@ let userBalance = 0;
 let selectedCase = null;
 let selectedItem = null;
 let isScanned = false;
+let scanTicket = null; // Id of the pending scan, sent back on discard
 let scanFee = 0;
 let lastOpenedCases = []; // История последних открытых кейсов
 let userDropHistory = []; // История выпадений скинов
@@ -252,6 +253,7 @@ function resetXRayState() {
     // Reset variables
     selectedItem = null;
     isScanned = false;
+    scanTicket = null;
     
     // Reset UI
     $('.xray-beam').removeClass('active').css('opacity', '');
@@ -352,8 +354,9 @@ function scanCase() {
         userBalance = data.new_balance;
         $('#header-balance').text(userBalance.toFixed(2));
         
-        // Store the won item for later use
+        // Store the won item and its ticket for later use
         selectedItem = data.wonItem;
+        scanTicket = data.ticket;
         
         // Wait for scan animation
         setTimeout(() => {
@@ -432,10 +435,12 @@ function addSkinToInventory() {
 
 // Discard current case and return to case selection
 function discardCase() {
+    const ticket = scanTicket;
+    
     // Reset X-Ray state
     resetXRayState();
     
-    // Call the discard API to clean up session data
+    // Drop the pending scan on the server
     fetch('/api/discard-case', {
         method: 'POST',
         headers: {
@@ -443,6 +448,7 @@ function discardCase() {
             'X-Security-Timestamp': Date.now().toString(),
         },
         body: JSON.stringify({
+            ticket: ticket,
             caseId: selectedCase._id
         })
     }).catch(error => {